@@ -20,6 +20,7 @@ from pmbacktest.strategies import (
     SignalStrategy,
     EventStrategy,
     Bar,
+    BarsSoA,
     MarketState,
 )
 
@@ -48,6 +49,7 @@ __all__ = [
     "SignalStrategy",
     "EventStrategy",
     "Bar",
+    "BarsSoA",
     "MarketState",
     # Portfolio
     "PortfolioManager",
@@ -3,15 +3,22 @@
 from __future__ import annotations
 
 import warnings
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from pmbacktest.strategies import Bar
 from pmbacktest.types import Outcome
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
+    from pathlib import Path
+
+    import pandas as pd
 
     from pmdata.client import PolymarketData
 
@@ -19,8 +26,31 @@ if TYPE_CHECKING:
 # Type alias for price data
 Prices = dict[str, dict[Outcome, float]]
 
-
-@dataclass
+# Packed record layout for columnar bar storage: 28 bytes per bar
+# versus a few hundred for a Bar dataclass instance
+BAR_DTYPE = np.dtype(
+    [
+        ("ts", "i8"),
+        ("o", "f4"),
+        ("h", "f4"),
+        ("l", "f4"),
+        ("c", "f4"),
+        ("v", "f4"),
+    ]
+)
+
+# Interval string -> seconds, hoisted so hot paths don't rebuild it
+_INTERVAL_SECONDS: dict[str, int] = {
+    "1m": 60,
+    "5m": 300,
+    "15m": 900,
+    "1h": 3600,
+    "6h": 21600,
+    "1d": 86400,
+}
+
+
+@dataclass(slots=True, frozen=True)
 class MarketDataPoint:
     """Single point of market data."""
 
@@ -29,6 +59,32 @@ class MarketDataPoint:
     bars: dict[str, Bar] = field(default_factory=dict)
 
 
+@dataclass(slots=True, frozen=True)
+class _FeedColumns:
+    """Columnar (structure-of-arrays) view of a feed's YES prices.
+
+    Built lazily from the point list so that range queries scan
+    contiguous NumPy arrays instead of chasing per-point dicts.
+
+    Attributes:
+        timestamps: int64 array of shape (T,)
+        yes_prices: float32 array of shape (T, M); NaN where a market
+            has no data at that timestamp (FP32 gives ~7 significant
+            digits, ample for prediction-market probabilities)
+        bars: BAR_DTYPE structured array of shape (T, M) holding
+            packed ts/o/h/l/c/v records; NaN fields where a market has
+            no bar
+        market_index: Maps market_id to its column in yes_prices/bars
+        is_sorted: Whether timestamps is non-decreasing
+    """
+
+    timestamps: np.ndarray
+    yes_prices: np.ndarray
+    bars: np.ndarray
+    market_index: dict[str, int]
+    is_sorted: bool
+
+
 class MarketDataFeed:
     """Data feed that iterates through historical market data.
 
@@ -54,6 +110,7 @@ class MarketDataFeed:
         self._data = data or []
         self.interval = interval
         self._index = 0
+        self._columns: _FeedColumns | None = None
 
     def __len__(self) -> int:
         """Return number of data points."""
@@ -79,10 +136,59 @@ class MarketDataFeed:
             point: Market data point to add
         """
         self._data.append(point)
+        self._columns = None
 
     def sort(self) -> None:
         """Sort data by timestamp."""
         self._data.sort(key=lambda x: x.timestamp)
+        self._columns = None
+
+    def _get_columns(self) -> _FeedColumns:
+        """Get (building if needed) the columnar view of the feed."""
+        if self._columns is None:
+            self._columns = self._build_columns()
+        return self._columns
+
+    def _build_columns(self) -> _FeedColumns:
+        """Build the columnar view from the point list."""
+        market_index: dict[str, int] = {}
+        for point in self._data:
+            for mid in point.prices:
+                if mid not in market_index:
+                    market_index[mid] = len(market_index)
+
+        num_points = len(self._data)
+        timestamps = np.fromiter(
+            (p.timestamp for p in self._data), dtype=np.int64, count=num_points
+        )
+        yes_prices = np.full((num_points, len(market_index)), np.nan, dtype=np.float32)
+        bars_arr = np.zeros((num_points, len(market_index)), dtype=BAR_DTYPE)
+        for name in ("o", "h", "l", "c", "v"):
+            bars_arr[name] = np.nan
+        for i, point in enumerate(self._data):
+            for mid, prices in point.prices.items():
+                yp = prices.get(Outcome.YES)
+                if yp is not None:
+                    yes_prices[i, market_index[mid]] = yp
+            for mid, bar in point.bars.items():
+                col = market_index.get(mid)
+                if col is not None:
+                    bars_arr[i, col] = (
+                        bar.timestamp,
+                        bar.open,
+                        bar.high,
+                        bar.low,
+                        bar.close,
+                        bar.volume,
+                    )
+
+        return _FeedColumns(
+            timestamps=timestamps,
+            yes_prices=yes_prices,
+            bars=bars_arr,
+            market_index=market_index,
+            is_sorted=bool(np.all(timestamps[1:] >= timestamps[:-1])),
+        )
 
     def get_price_range(
         self,
@@ -100,13 +206,36 @@ class MarketDataFeed:
         Returns:
             List of (timestamp, price) tuples
         """
-        result = []
-        for point in self._data:
-            if start_ts <= point.timestamp <= end_ts:
-                prices = point.prices.get(market_id, {})
-                if Outcome.YES in prices:
-                    result.append((point.timestamp, prices[Outcome.YES]))
-        return result
+        cols = self._get_columns()
+        col = cols.market_index.get(market_id)
+        if col is None:
+            return []
+
+        timestamps = cols.timestamps
+        if cols.is_sorted:
+            # O(log N) bounds instead of comparing every point
+            lo = int(np.searchsorted(timestamps, start_ts, side="left"))
+            hi = int(np.searchsorted(timestamps, end_ts, side="right"))
+            timestamps = timestamps[lo:hi]
+            prices = cols.yes_prices[lo:hi, col]
+            mask = ~np.isnan(prices)
+        else:
+            prices = cols.yes_prices[:, col]
+            mask = (timestamps >= start_ts) & (timestamps <= end_ts) & ~np.isnan(prices)
+        return list(zip(timestamps[mask].tolist(), prices[mask].tolist(), strict=True))
+
+    def ohlcv_arrays(self) -> tuple[np.ndarray, list[str], np.ndarray]:
+        """Get the feed's bar data as columnar arrays.
+
+        Returns:
+            Tuple of (timestamps, market_ids, bars) where timestamps
+            has shape (T,), market_ids orders the M columns, and bars
+            is a BAR_DTYPE structured array of shape (T, M); index its
+            "o"/"h"/"l"/"c"/"v" fields for the per-bar columns (NaN
+            where a market has no bar).
+        """
+        cols = self._get_columns()
+        return cols.timestamps, list(cols.market_index), cols.bars
 
 
 class MockDataFeed(MarketDataFeed):
@@ -132,44 +261,43 @@ class MockDataFeed(MarketDataFeed):
             start_price: Starting price
             interval: Time interval
         """
-        import random
-
         super().__init__(interval=interval)
 
         base_ts = int(datetime(2024, 1, 1).timestamp())
         interval_seconds = self._get_interval_seconds()
 
+        # Draw all randomness up front so the per-point cost is just
+        # dataclass construction rather than scalar RNG calls.
+        rng = np.random.default_rng()
+        shape = (num_points, num_markets)
+        # Random walk with mean reversion, clamped to valid price range
+        prices_arr = np.clip(0.5 + rng.normal(0, 0.02, shape), 0.05, 0.95)
+        highs_arr = prices_arr + np.abs(rng.normal(0, 0.01, shape))
+        lows_arr = prices_arr - np.abs(rng.normal(0, 0.01, shape))
+        closes_arr = np.clip(prices_arr + rng.normal(0, 0.005, shape), 0.01, 0.99)
+        volumes_arr = rng.uniform(1000, 10000, shape)
+        timestamps = base_ts + np.arange(num_points) * interval_seconds
+
+        market_ids = [f"market_{m}" for m in range(num_markets)]
+
         for i in range(num_points):
-            timestamp = base_ts + i * interval_seconds
+            timestamp = int(timestamps[i])
             prices = {}
             bars = {}
 
-            for m in range(num_markets):
-                market_id = f"market_{m}"
-                # Random walk with mean reversion
-                change = random.gauss(0, 0.02)
-                price = 0.5 + change
-                price = max(0.05, min(0.95, price))  # Clamp
-
+            for m, market_id in enumerate(market_ids):
+                price = float(prices_arr[i, m])
                 prices[market_id] = {
                     Outcome.YES: price,
                     Outcome.NO: 1 - price,
                 }
-
-                # Generate bar
-                open_price = price
-                high_price = price + abs(random.gauss(0, 0.01))
-                low_price = price - abs(random.gauss(0, 0.01))
-                close_price = price + random.gauss(0, 0.005)
-                close_price = max(0.01, min(0.99, close_price))
-
                 bars[market_id] = Bar(
                     timestamp=timestamp,
-                    open=open_price,
-                    high=high_price,
-                    low=low_price,
-                    close=close_price,
-                    volume=random.uniform(1000, 10000),
+                    open=price,
+                    high=float(highs_arr[i, m]),
+                    low=float(lows_arr[i, m]),
+                    close=float(closes_arr[i, m]),
+                    volume=float(volumes_arr[i, m]),
                 )
 
             self._data.append(
@@ -182,15 +310,49 @@ class MockDataFeed(MarketDataFeed):
 
     def _get_interval_seconds(self) -> int:
         """Convert interval string to seconds."""
-        mapping = {
-            "1m": 60,
-            "5m": 300,
-            "15m": 900,
-            "1h": 3600,
-            "6h": 21600,
-            "1d": 86400,
-        }
-        return mapping.get(self.interval, 3600)
+        return _INTERVAL_SECONDS.get(self.interval, 3600)
+
+
+def _cached_ohlcv(
+    pmdata_client: PolymarketData,
+    token_id: str,
+    start: int | datetime,
+    end: int | datetime,
+    interval: str,
+    cache_dir: Path | None,
+) -> pd.DataFrame | None:
+    """Fetch OHLCV, backed by a per-request parquet cache when enabled.
+
+    Args:
+        pmdata_client: PolymarketData instance
+        token_id: CLOB token id to fetch
+        start: Start timestamp (unix int or datetime)
+        end: End timestamp (unix int or datetime)
+        interval: OHLCV interval
+        cache_dir: Directory for cached parquet files, or None to
+            always fetch
+
+    Returns:
+        OHLCV DataFrame indexed by timestamp
+    """
+    if cache_dir is None:
+        return pmdata_client.get_ohlcv(token_id, start, end, interval)
+
+    import pandas as pd
+
+    start_ts = int(start.timestamp()) if isinstance(start, datetime) else int(start)
+    end_ts = int(end.timestamp()) if isinstance(end, datetime) else int(end)
+    safe = token_id.replace("/", "_")[:64]
+    path = cache_dir / f"{safe}_{interval}_{start_ts}_{end_ts}.parquet"
+
+    if path.exists():
+        return pd.read_parquet(path)
+
+    df = pmdata_client.get_ohlcv(token_id, start, end, interval)
+    if df is not None and not df.empty:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(path, compression="zstd")
+    return df
 
 
 def create_data_feed_from_pmdata(
@@ -199,6 +361,7 @@ def create_data_feed_from_pmdata(
     start: int | datetime,
     end: int | datetime,
     interval: str = "1h",
+    cache_dir: Path | None = None,
 ) -> MarketDataFeed:
     """Create data feed from PolymarketData client.
 
@@ -208,6 +371,9 @@ def create_data_feed_from_pmdata(
         start: Start timestamp (unix int or datetime)
         end: End timestamp (unix int or datetime)
         interval: OHLCV interval ("1m", "5m", "15m", "1h", "6h", "1d")
+        cache_dir: Optional directory for persisting fetched OHLCV as
+            parquet, keyed by (token_id, interval, start, end); repeat
+            runs load from disk instead of re-fetching
 
     Returns:
         MarketDataFeed with historical data sorted by timestamp
@@ -215,10 +381,14 @@ def create_data_feed_from_pmdata(
     Raises:
         ValueError: If a market has more than 2 outcomes (non-binary market)
     """
-    # Collect per-market data: {market_id: {timestamp: (Bar, yes_price)}}
-    market_ts_data: dict[str, dict[int, tuple[Bar, float]]] = {}
-
-    for market_id in market_ids:
+    # Bind the enum members once; avoids hash+eq on Outcome per lookup
+    # in the loops below
+    yes_outcome = Outcome.YES
+    no_outcome = Outcome.NO
+
+    # Fetch markets concurrently: each fetch is HTTP-bound, so
+    # serializing them would multiply latency by len(market_ids)
+    def fetch_one(market_id: str) -> dict[int, tuple[Bar, float]] | None:
         market = pmdata_client.get_market(market_id)
 
         if len(market.outcomes) != 2:
@@ -230,71 +400,103 @@ def create_data_feed_from_pmdata(
         # Find YES token id case-insensitively
         yes_token_id: str | None = None
         for outcome_label, token_id in zip(market.outcomes, market.clob_token_ids, strict=True):
-            if outcome_label.lower() == Outcome.YES:
+            if outcome_label.lower() == yes_outcome:
                 yes_token_id = token_id
                 break
 
         if yes_token_id is None:
             warnings.warn(
                 f"Market {market_id!r} has no 'yes' outcome; skipping.",
-                stacklevel=2,
+                stacklevel=3,
             )
-            continue
+            return None
 
-        df = pmdata_client.get_ohlcv(yes_token_id, start, end, interval)
+        df = _cached_ohlcv(pmdata_client, yes_token_id, start, end, interval, cache_dir)
 
         if df is None or df.empty:
             warnings.warn(
                 f"Market {market_id!r} returned empty OHLCV data; skipping.",
-                stacklevel=2,
+                stacklevel=3,
             )
-            continue
+            return None
+
+        # Pull raw columns once instead of boxing a Series per row (iterrows)
+        timestamps = df.index.to_numpy().astype("int64")
+        ohlcv = df[["open", "high", "low", "close", "volume"]].to_numpy()
 
         ts_map: dict[int, tuple[Bar, float]] = {}
-        for idx, row in df.iterrows():
-            ts = int(idx)
+        for ts, (o, h, lo, c, v) in zip(timestamps, ohlcv, strict=True):
+            ts = int(ts)
+            yes_price = float(c)
             bar = Bar(
                 timestamp=ts,
-                open=float(row["open"]),
-                high=float(row["high"]),
-                low=float(row["low"]),
-                close=float(row["close"]),
-                volume=float(row["volume"]),
+                open=float(o),
+                high=float(h),
+                low=float(lo),
+                close=yes_price,
+                volume=float(v),
             )
-            yes_price = float(row["close"])
             ts_map[ts] = (bar, yes_price)
+        return ts_map
 
-        market_ts_data[market_id] = ts_map
-
-    # Collect union of all timestamps across markets
-    all_timestamps: set[int] = set()
-    for ts_map in market_ts_data.values():
-        all_timestamps.update(ts_map.keys())
-
-    sorted_timestamps = sorted(all_timestamps)
+    if len(market_ids) > 1:
+        with ThreadPoolExecutor(max_workers=min(16, len(market_ids))) as executor:
+            results = list(executor.map(fetch_one, market_ids))
+    else:
+        results = [fetch_one(mid) for mid in market_ids]
 
-    # Forward-fill: track last known data per market
-    last_bar: dict[str, Bar] = {}
+    # Collect per-market data: {market_id: {timestamp: (Bar, yes_price)}}
+    market_ts_data: dict[str, dict[int, tuple[Bar, float]]] = {
+        mid: ts_map
+        for mid, ts_map in zip(market_ids, results, strict=True)
+        if ts_map is not None
+    }
+
+    # Sorted union of all timestamps across markets, without an
+    # intermediate Python set of boxed ints
+    if market_ts_data:
+        ts_arrays = [
+            np.fromiter(ts_map.keys(), dtype=np.int64, count=len(ts_map))
+            for ts_map in market_ts_data.values()
+        ]
+        sorted_timestamps = np.unique(np.concatenate(ts_arrays)).tolist()
+    else:
+        sorted_timestamps = []
+
+    # Reverse index: which markets have fresh data at each timestamp,
+    # so the fill loop only touches markets that actually updated
+    updates_at_ts: dict[int, list[str]] = defaultdict(list)
+    for mid, ts_map in market_ts_data.items():
+        for ts in ts_map:
+            updates_at_ts[ts].append(mid)
+
+    # Forward-fill: maintain running prices/bars dicts and snapshot
+    # them per point with a C-level copy. The inner {YES, NO} dict is
+    # shared across points until the price actually changes, avoiding
+    # an allocation per market per bar.
     last_yes_price: dict[str, float] = {}
+    current_prices: dict[str, dict[Outcome, float]] = {}
+    current_bars: dict[str, Bar] = {}
 
     points: list[MarketDataPoint] = []
     for ts in sorted_timestamps:
-        prices: dict[str, dict[Outcome, float]] = {}
-        bars: dict[str, Bar] = {}
-
-        for mid, ts_map in market_ts_data.items():
-            if ts in ts_map:
-                bar, yes_price = ts_map[ts]
-                last_bar[mid] = bar
+        for mid in updates_at_ts[ts]:
+            bar, yes_price = market_ts_data[mid][ts]
+            current_bars[mid] = bar
+            if yes_price != last_yes_price.get(mid):
                 last_yes_price[mid] = yes_price
+                current_prices[mid] = {
+                    yes_outcome: yes_price,
+                    no_outcome: 1.0 - yes_price,
+                }
 
-            if mid in last_yes_price:
-                yp = last_yes_price[mid]
-                prices[mid] = {Outcome.YES: yp, Outcome.NO: 1.0 - yp}
-                bars[mid] = last_bar[mid]
-
-        points.append(MarketDataPoint(timestamp=ts, prices=prices, bars=bars))
+        points.append(
+            MarketDataPoint(
+                timestamp=ts,
+                prices=current_prices.copy(),
+                bars=current_bars.copy(),
+            )
+        )
 
-    feed = MarketDataFeed(data=points, interval=interval)
-    feed.sort()
-    return feed
+    # points is built from the sorted timestamp union, so no re-sort
+    return MarketDataFeed(data=points, interval=interval)
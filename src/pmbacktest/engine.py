@@ -5,6 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any
 
+import numpy as np
+
 from pmbacktest.config import Config
 from pmbacktest.data import MarketDataFeed, MarketDataPoint
 from pmbacktest.execution import ExecutionHandler
@@ -14,7 +16,7 @@ from pmbacktest.strategies import MarketState, Strategy
 from pmbacktest.types import OrderSide, Outcome, Signal
 
 
-@dataclass
+@dataclass(slots=True)
 class BacktestResult:
     """Results from a backtest run."""
 
@@ -27,13 +29,7 @@ class BacktestResult:
     equity_history: list[tuple[int, float]]
     trades: list[Any]  # Trade records
     config: Config
-
-    @property
-    def win_rate(self) -> float:
-        """Win rate as percentage."""
-        if self.total_trades == 0:
-            return 0.0
-        return self.winning_trades / self.total_trades
+    win_rate: float = 0.0
 
 
 class BacktestEngine:
@@ -63,6 +59,11 @@ class BacktestEngine:
             config=self.config.backtest.to_execution_config()
         )
         self.risk = RiskManager(config=self.config.risk)
+        # O(1) side dispatch for the signal hot path
+        self._side_dispatch = {
+            OrderSide.BUY: self.portfolio.execute_buy,
+            OrderSide.SELL: self.portfolio.execute_sell,
+        }
         self.strategies: list[Strategy] = []
         self._data: MarketDataFeed | None = None
         self._result: BacktestResult | None = None
@@ -86,49 +87,90 @@ class BacktestEngine:
         """
         self._data = data
         self._result = None
+        self.portfolio.reserve_history(len(data))
 
         # Initialize strategies
         for strategy in self.strategies:
             strategy.on_init()
 
-        # Initialize daily tracking
-        current_day = None
-        self.risk.start_new_day(self.portfolio.total_equity)
+        # Batch-evaluate strategies that support the vectorized path
+        vector_signals = self._vectorize_strategies(data)
+        if vector_signals is not None:
+            vectorized, pending = vector_signals
+            bar_strategies = [s for s in self.strategies if s not in vectorized]
+        else:
+            pending = {}
+            bar_strategies = self.strategies
+
+        # Precompute subscriptions once; None means "all markets"
+        subscriptions = [(s, s.subscribed_markets) for s in bar_strategies]
+
+        # Bind hot attributes to locals; the loop below touches them
+        # once per bar and CPython attribute dispatch adds up
+        portfolio = self.portfolio
+        mark_to_market = portfolio.mark_to_market
+        record_equity = portfolio.record_equity
+        start_new_day = self.risk.start_new_day
+        execute_signal = self._execute_signal
+
+        # Initialize daily tracking; next_day_ts marks the first
+        # timestamp of the next UTC day so the loop only compares
+        next_day_ts: int | None = None
+        start_new_day(portfolio.total_equity)
 
         # Main event loop
-        for data_point in data:
+        for i, data_point in enumerate(data):
             timestamp = data_point.timestamp
             prices = data_point.prices
             bars = data_point.bars
 
-            # Track day changes
-            day = timestamp // 86400
-            if current_day is not None and day != current_day:
-                self.risk.start_new_day(self.portfolio.total_equity)
-            current_day = day
+            # Track day changes with a single comparison per bar
+            if next_day_ts is None:
+                next_day_ts = (timestamp // 86400 + 1) * 86400
+            elif timestamp >= next_day_ts:
+                start_new_day(portfolio.total_equity)
+                next_day_ts = (timestamp // 86400 + 1) * 86400
 
             # Mark to market
-            self.portfolio.mark_to_market(prices)
-
-            # Build market state
-            state = MarketState(
-                timestamp=timestamp,
-                prices=prices,
-                bars=bars,
-                positions=self.portfolio.positions,
-                cash=self.portfolio.cash,
-                portfolio_value=self.portfolio.total_equity,
-            )
-
-            # Generate signals from strategies
-            for strategy in self.strategies:
-                signals = strategy.on_bar(state)
-                if signals:
-                    for signal in signals:
-                        self._execute_signal(signal, prices, timestamp, strategy)
+            mark_to_market(prices)
+
+            # Generate signals from per-bar strategies whose
+            # subscribed markets have data at this point
+            active = [
+                strategy
+                for strategy, subscribed in subscriptions
+                if subscribed is None or not prices.keys().isdisjoint(subscribed)
+            ]
+            if active:
+                state = MarketState(
+                    timestamp=timestamp,
+                    prices=prices,
+                    bars=bars,
+                    positions=portfolio.positions,
+                    cash=portfolio.cash,
+                    portfolio_value=portfolio.total_equity,
+                )
+                for strategy in active:
+                    signals = strategy.on_bar(state)
+                    if signals:
+                        for signal in signals:
+                            execute_signal(signal, prices, timestamp, strategy)
+
+            # Execute precomputed vectorized signals for this bar
+            for strategy, market_id, side in pending.get(i, ()):
+                signal = Signal(
+                    market_id=market_id,
+                    outcome=Outcome.YES,
+                    action=side,
+                    size=0.0,
+                )
+                signal.size = self.risk.calculate_position_size(
+                    signal, portfolio.total_equity
+                )
+                execute_signal(signal, prices, timestamp, strategy)
 
             # Record equity
-            self.portfolio.record_equity(timestamp)
+            record_equity(timestamp)
 
         # Finalize
         for strategy in self.strategies:
@@ -141,6 +183,52 @@ class BacktestEngine:
 
         return self._build_result()
 
+    def _vectorize_strategies(
+        self,
+        data: MarketDataFeed,
+    ) -> tuple[set[Strategy], dict[int, list[tuple[Strategy, str, OrderSide]]]] | None:
+        """Batch-evaluate strategies that implement vectorize().
+
+        Args:
+            data: Market data feed
+
+        Returns:
+            Tuple of (vectorized strategies, pending signals) where
+            pending maps bar index to (strategy, market_id, side)
+            triples, or None if no strategy supports the batch path.
+        """
+        timestamps, market_ids, bars = data.ohlcv_arrays()
+        if len(timestamps) == 0 or not market_ids:
+            return None
+
+        opens = bars["o"]
+        highs = bars["h"]
+        lows = bars["l"]
+        closes = bars["c"]
+        volumes = bars["v"]
+
+        vectorized: set[Strategy] = set()
+        pending: dict[int, list[tuple[Strategy, str, OrderSide]]] = {}
+        for strategy in self.strategies:
+            codes = strategy.vectorize(timestamps, opens, highs, lows, closes, volumes)
+            if codes is None:
+                continue
+            codes = np.asarray(codes)
+            if codes.shape != (len(timestamps), len(market_ids)):
+                raise ValueError(
+                    f"Strategy {strategy.name!r} vectorize() returned shape "
+                    f"{codes.shape}; expected {(len(timestamps), len(market_ids))}."
+                )
+            vectorized.add(strategy)
+            rows, cols = np.nonzero(codes)
+            for r, c in zip(rows.tolist(), cols.tolist(), strict=True):
+                side = OrderSide.BUY if codes[r, c] > 0 else OrderSide.SELL
+                pending.setdefault(r, []).append((strategy, market_ids[c], side))
+
+        if not vectorized:
+            return None
+        return vectorized, pending
+
     def _execute_signal(
         self,
         signal: Signal,
@@ -156,15 +244,19 @@ class BacktestEngine:
             timestamp: Current timestamp
             strategy: Strategy that generated signal
         """
+        # Bind once; these are re-read several times below
+        market_id = signal.market_id
+        outcome = signal.outcome
+
         # Get current price
-        market_prices = prices.get(signal.market_id, {})
-        current_price = market_prices.get(signal.outcome)
+        market_prices = prices.get(market_id, {})
+        current_price = market_prices.get(outcome)
 
         if current_price is None:
             return
 
         # Get position for stop loss
-        position = self.portfolio.get_position(signal.market_id, signal.outcome)
+        position = self.portfolio.get_position(market_id, outcome)
         entry_price = position.entry_price if position else None
 
         # Execute with stop loss check
@@ -173,11 +265,12 @@ class BacktestEngine:
         ):
             # Stop loss triggered - close position
             fill = self.portfolio.execute_sell(
-                signal.market_id,
-                signal.outcome,
-                -1,  # Sell all
+                market_id,
+                outcome,
+                0.0,
                 current_price,
                 timestamp,
+                sell_all=True,
             )
             if fill:
                 strategy.on_fill(fill)
@@ -187,40 +280,36 @@ class BacktestEngine:
         if not self.risk.check_signal(signal, self.portfolio.total_equity):
             return
 
-        # Execute order
-        if signal.action == OrderSide.BUY:
-            fill = self.execution.execute(signal, current_price, timestamp)
-            if fill:
-                # Apply commission to cash
-                self.portfolio.cash -= fill.commission
-                # Execute buy in portfolio
-                buy_fill = self.portfolio.execute_buy(
-                    signal.market_id,
-                    signal.outcome,
-                    signal.size,
-                    fill.price,
-                    timestamp,
-                )
-                if buy_fill:
-                    strategy.on_fill(buy_fill)
-        else:
-            fill = self.execution.execute(signal, current_price, timestamp)
-            if fill:
-                sell_fill = self.portfolio.execute_sell(
-                    signal.market_id,
-                    signal.outcome,
-                    signal.size,
-                    fill.price,
-                    timestamp,
-                )
-                if sell_fill:
-                    strategy.on_fill(sell_fill)
+        # Execute order; both sides share the same scaffolding, so
+        # dispatch through the side table instead of branching
+        fill = self.execution.execute(signal, current_price, timestamp)
+        if not fill:
+            return
+
+        # Apply commission to cash
+        self.portfolio.cash -= fill.commission
+        result_fill = self._side_dispatch[signal.action](
+            market_id,
+            outcome,
+            signal.size,
+            fill.price,
+            timestamp,
+        )
+        if result_fill:
+            strategy.on_fill(result_fill)
 
     def _build_result(self) -> BacktestResult:
         """Build final result from backtest."""
         trades = self.portfolio.trades
-        winning = sum(1 for t in trades if t.pnl > 0)
-        losing = sum(1 for t in trades if t.pnl < 0)
+        # Single pass over trades instead of one generator per stat
+        winning = 0
+        losing = 0
+        for t in trades:
+            pnl = t.pnl
+            if pnl > 0:
+                winning += 1
+            elif pnl < 0:
+                losing += 1
 
         initial = self.config.backtest.initial_capital
         final = self.portfolio.total_equity
@@ -235,6 +324,7 @@ class BacktestEngine:
             equity_history=self.portfolio.equity_history,
             trades=trades,
             config=self.config,
+            win_rate=winning / len(trades) if trades else 0.0,
         )
 
     @property
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Callable
 
+import numpy as np
+
 from pmbacktest.types import (
     FeeCalculator,
     Fill,
@@ -58,13 +61,84 @@ def no_fee_calculator(price: float, quantity: float, is_maker: bool) -> float:
     return 0.0
 
 
-@dataclass
+# Quantization grid for the opt-in fee cache: Polymarket prices move
+# in 1c ticks, so keying on 1/100-cent price ticks and cent-sized
+# quantity buckets gives a high hit rate across repeated runs
+_FEE_PRICE_TICKS = 10000
+_FEE_QTY_STEP = 0.01
+
+
+@lru_cache(maxsize=8192)
+def _default_fee_cached(price_ticks: int, qty_steps: int) -> float:
+    """Memoized default taker fee on the quantized (price, qty) grid."""
+    price = price_ticks / _FEE_PRICE_TICKS
+    return 0.02 * price * price * (1 - price) * (qty_steps * _FEE_QTY_STEP)
+
+
+# Integer order-type codes for the scalar execution core
+_OT_OTHER = 0
+_OT_LIMIT = 1
+_OT_STOP = 2
+
+_ORDER_TYPE_CODES = {
+    OrderType.LIMIT: _OT_LIMIT,
+    OrderType.STOP: _OT_STOP,
+}
+
+
+def _exec_core(
+    price: float,
+    sign: int,
+    order_type_code: int,
+    limit_price: float | None,
+    stop_price: float | None,
+    size: float,
+    slippage: float,
+) -> tuple[float, float]:
+    """Numeric core of execute() on primitive scalars.
+
+    Runs once per signal per tick, so it is kept free of attribute
+    lookups and enum comparisons: the caller passes the side as a
+    +1/-1 sign and the order type as an int code. Returns
+    (fill_price, token_amount); token_amount <= 0 means the order
+    did not fill.
+
+    Args:
+        price: Current market price
+        sign: +1 for buy, -1 for sell
+        order_type_code: One of the _OT_* codes
+        limit_price: Limit price, or None
+        stop_price: Stop price, or None
+        size: Dollar amount to trade
+        slippage: Fractional slippage per side
+
+    Returns:
+        Tuple of (fill_price, token_amount)
+    """
+    # Branchless: buys pay up, sells give up, via the side sign
+    fill_price = price * (1.0 + sign * slippage)
+
+    if order_type_code == _OT_LIMIT and limit_price is not None:
+        if sign * (fill_price - limit_price) > 0:
+            return fill_price, 0.0  # Beyond the limit
+    elif order_type_code == _OT_STOP and stop_price is not None:
+        if sign * (price - stop_price) < 0:
+            return fill_price, 0.0  # Stop not triggered
+
+    token_amount = size / fill_price if fill_price > 0 else 0.0
+    return fill_price, token_amount
+
+
+@dataclass(slots=True)
 class ExecutionConfig:
     """Configuration for execution simulation."""
 
     slippage_pct: float = 0.0  # Percentage slippage (0.001 = 0.1%)
     fee_calculator: Callable[[float, float, bool], float] = default_fee_calculator
     default_slippage: float = 0.0
+    # Memoize the default fee on a quantized (price, quantity) grid;
+    # useful for parameter sweeps that revisit the same fills
+    cache_fees: bool = False
 
 
 class ExecutionHandler:
@@ -81,6 +155,18 @@ class ExecutionHandler:
             config: Execution configuration
         """
         self.config = config or ExecutionConfig()
+        # Resolve the fee calculator once; the known module-level
+        # calculators are inlined in execute() so the common case pays
+        # no indirect call per fill (0=none, 1=flat, 2=poly, 3=custom)
+        fee_fn = self.config.fee_calculator
+        if fee_fn is no_fee_calculator:
+            self._fee_mode = 0
+        elif fee_fn is flat_fee_calculator:
+            self._fee_mode = 1
+        elif fee_fn is default_fee_calculator:
+            self._fee_mode = 2
+        else:
+            self._fee_mode = 3
 
     def execute(
         self,
@@ -98,37 +184,38 @@ class ExecutionHandler:
         Returns:
             Fill object if executed, None if order not filled (limit order)
         """
-        # Apply slippage to determine fill price
-        fill_price = self._apply_slippage(
+        # Slippage, limit/stop gating, and sizing all happen in the
+        # scalar core; the wrapper only boxes the result into
+        # Order/Fill on success
+        fill_price, token_amount = _exec_core(
             current_price,
-            signal.action,
+            signal.action.sign,
+            _ORDER_TYPE_CODES.get(signal.order_type, _OT_OTHER),
+            signal.limit_price,
+            signal.stop_price,
+            signal.size,
+            self.config.slippage_pct,
         )
 
-        # Check if limit order condition is met
-        if signal.order_type == OrderType.LIMIT:
-            if signal.limit_price is not None:
-                if signal.action == OrderSide.BUY and fill_price > signal.limit_price:
-                    return None  # Price too high
-                if signal.action == OrderSide.SELL and fill_price < signal.limit_price:
-                    return None  # Price too low
-
-        # Check stop order
-        if signal.order_type == OrderType.STOP:
-            if signal.stop_price is not None:
-                if signal.action == OrderSide.BUY and current_price < signal.stop_price:
-                    return None  # Stop not triggered
-                if signal.action == OrderSide.SELL and current_price > signal.stop_price:
-                    return None  # Stop not triggered
-
-        # Calculate token amount
-        dollar_amount = signal.size
-        token_amount = dollar_amount / fill_price if fill_price > 0 else 0
-
         if token_amount <= 0:
             return None
 
-        # Calculate fee
-        fee = self.config.fee_calculator(fill_price, token_amount, is_maker=False)
+        # Calculate fee (taker); known calculators are inlined
+        fee_mode = self._fee_mode
+        if fee_mode == 0:
+            fee = 0.0
+        elif fee_mode == 1:
+            fee = 0.001 * fill_price * token_amount
+        elif fee_mode == 2:
+            if self.config.cache_fees:
+                fee = _default_fee_cached(
+                    round(fill_price * _FEE_PRICE_TICKS),
+                    round(token_amount / _FEE_QTY_STEP),
+                )
+            else:
+                fee = 0.02 * fill_price * fill_price * (1 - fill_price) * token_amount
+        else:
+            fee = self.config.fee_calculator(fill_price, token_amount, is_maker=False)
 
         # Create order and fill
         order = Order(
@@ -136,8 +223,6 @@ class ExecutionHandler:
             status="filled",
         )
 
-        from datetime import datetime
-
         fill = Fill(
             order=order,
             market_id=signal.market_id,
@@ -146,11 +231,56 @@ class ExecutionHandler:
             quantity=token_amount,
             price=fill_price,
             commission=fee,
-            timestamp=datetime.fromtimestamp(timestamp) if timestamp else datetime.now(),
+            timestamp=timestamp,
         )
 
         return fill
 
+    def execute_batch(
+        self,
+        prices: np.ndarray,
+        sides: np.ndarray,
+        otypes: np.ndarray,
+        limits: np.ndarray,
+        stops: np.ndarray,
+        sizes: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Execute many signals at once with array operations.
+
+        Vectorized counterpart of execute() for strategies that emit
+        bar-aligned signals: slippage, limit/stop rejection, and
+        sizing are each a single pass over contiguous float64 instead
+        of a Python call per signal. The sign-encoded side lets the
+        limit and stop checks share one branchless comparison per
+        array.
+
+        Args:
+            prices: Current market prices, shape (N,)
+            sides: +1 for buy, -1 for sell, shape (N,)
+            otypes: Order-type codes (_OT_* values), shape (N,)
+            limits: Limit prices, NaN where unset, shape (N,)
+            stops: Stop prices, NaN where unset, shape (N,)
+            sizes: Dollar amounts, shape (N,)
+
+        Returns:
+            Tuple of (fill_prices, token_amounts, filled_mask); only
+            entries where filled_mask is True represent fills.
+        """
+        slippage = self.config.slippage_pct
+        fill_px = prices * (1.0 + sides * slippage)
+
+        # sign*(fill - limit) > 0 rejects buys above and sells below
+        # the limit; sign*(price - stop) < 0 rejects untriggered stops
+        with np.errstate(invalid="ignore"):
+            rejected = (otypes == _OT_LIMIT) & (sides * (fill_px - limits) > 0)
+            rejected |= (otypes == _OT_STOP) & (sides * (prices - stops) < 0)
+
+        qty = np.divide(
+            sizes, fill_px, out=np.zeros_like(fill_px), where=fill_px > 0
+        )
+        filled = ~rejected & (qty > 0)
+        return fill_px, qty, filled
+
     def _apply_slippage(
         self,
         price: float,
@@ -165,14 +295,9 @@ class ExecutionHandler:
         Returns:
             Price after slippage
         """
-        slippage = self.config.slippage_pct
-
-        if side == OrderSide.BUY:
-            # Buy orders execute at higher price
-            return price * (1 + slippage)
-        else:
-            # Sell orders execute at lower price
-            return price * (1 - slippage)
+        # Buys execute higher, sells lower; the side sign makes this a
+        # single multiply with no enum comparison
+        return price * (1.0 + side.sign * self.config.slippage_pct)
 
     def check_stop_loss(
         self,
@@ -193,7 +318,7 @@ class ExecutionHandler:
         if signal.stop_price is None:
             return False
 
-        if signal.action == OrderSide.BUY:
+        if signal.action is OrderSide.BUY:
             # Stop loss on sell means price fell below stop
             return current_price <= signal.stop_price
         else:
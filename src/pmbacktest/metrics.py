@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetrics:
     """Comprehensive performance metrics."""
 
@@ -46,33 +47,55 @@ def calculate_metrics(
     if len(equity_history) < 2:
         return _empty_metrics()
 
-    equity_values = [e[1] for e in equity_history]
-    returns = np.diff(equity_values) / equity_values[:-1]
+    # Single conversion to float64; all statistics below are vector
+    # reductions over these arrays rather than list passes
+    eq = np.fromiter(
+        (e[1] for e in equity_history), dtype=np.float64, count=len(equity_history)
+    )
+    returns = np.diff(eq) / eq[:-1]
     returns = returns[~np.isnan(returns)]  # Remove NaN
 
     if len(returns) == 0:
         return _empty_metrics()
 
     # Total return
-    total_return = (equity_values[-1] - equity_values[0]) / equity_values[0] if equity_values[0] > 0 else 0
-
-    # Sharpe ratio (annualized)
-    if len(returns) > 1 and np.std(returns) > 0:
-        sharpe = (np.mean(returns) - risk_free_rate / 252) / np.std(returns) * np.sqrt(252)
+    total_return = float((eq[-1] - eq[0]) / eq[0]) if eq[0] > 0 else 0
+
+    # Sharpe and Sortino (annualized) share one read of the returns
+    # array: accumulate count, sum, and sum of squares (overall and
+    # downside) and derive both deviations, instead of separate
+    # mean/std passes plus a downside gather
+    n = len(returns)
+    sq = returns * returns
+    neg = returns < 0
+    r_sum = float(returns.sum())
+    r_sq = float(sq.sum())
+    dn = int(neg.sum())
+    d_sum = float(returns.sum(where=neg))
+    d_sq = float(sq.sum(where=neg))
+
+    mean = r_sum / n
+    excess = mean - risk_free_rate / 252
+    ann = math.sqrt(252)
+
+    var = r_sq / n - mean * mean
+    std = math.sqrt(var) if var > 0 else 0.0
+    sharpe = excess / std * ann if n > 1 and std > 0 else 0.0
+
+    if dn > 1:
+        d_mean = d_sum / dn
+        dvar = d_sq / dn - d_mean * d_mean
+        dstd = math.sqrt(dvar) if dvar > 0 else 0.0
     else:
-        sharpe = 0.0
+        dstd = 0.0
+    sortino = excess / dstd * ann if dstd > 0 else 0.0
 
-    # Sortino ratio
-    downside_returns = returns[returns < 0]
-    if len(downside_returns) > 1 and np.std(downside_returns) > 0:
-        sortino = (np.mean(returns) - risk_free_rate / 252) / np.std(downside_returns) * np.sqrt(252)
-    else:
-        sortino = 0.0
-
-    # Max drawdown
-    running_max = np.maximum.accumulate(equity_values)
-    drawdowns = (equity_values - running_max) / running_max
-    max_dd = abs(np.min(drawdowns)) if len(drawdowns) > 0 else 0
+    # Max drawdown: (eq - rm) / rm == eq / rm - 1, so the deepest
+    # drawdown is 1 - min(eq / rm); dividing in place reuses the
+    # running-max buffer instead of allocating two temporaries
+    running_max = np.maximum.accumulate(eq)
+    np.divide(eq, running_max, out=running_max)
+    max_dd = 1.0 - float(running_max.min())
 
     # Calmar ratio (annual return / max drawdown)
     if max_dd > 0:
@@ -80,22 +103,27 @@ def calculate_metrics(
     else:
         calmar = 0.0
 
-    # Trade statistics
-    if trades:
-        pnls = [t.pnl for t in trades if hasattr(t, 'pnl')]
-        winners = [p for p in pnls if p > 0]
-        losers = [p for p in pnls if p < 0]
-
-        total_trades = len(pnls)
-        win_rate = len(winners) / total_trades if total_trades > 0 else 0
-        avg_trade = np.mean(pnls) if pnls else 0
-        avg_win = np.mean(winners) if winners else 0
-        avg_loss = np.mean(losers) if losers else 0
-        largest_winner = max(winners) if winners else 0
-        largest_loser = min(losers) if losers else 0
-
-        gross_profit = sum(winners) if winners else 0
-        gross_loss = abs(sum(losers)) if losers else 1
+    # Trade statistics: one array conversion, then boolean masks
+    # instead of re-walking Python lists per statistic
+    pnls = np.asarray(
+        [t.pnl for t in trades if hasattr(t, 'pnl')], dtype=np.float64
+    )
+    total_trades = len(pnls)
+    if total_trades > 0:
+        pos = pnls > 0
+        neg = pnls < 0
+        winners = pnls[pos]
+        losers = pnls[neg]
+
+        win_rate = len(winners) / total_trades
+        avg_trade = float(pnls.mean())
+        avg_win = float(winners.mean()) if len(winners) else 0
+        avg_loss = float(losers.mean()) if len(losers) else 0
+        largest_winner = float(winners.max()) if len(winners) else 0
+        largest_loser = float(losers.min()) if len(losers) else 0
+
+        gross_profit = float(winners.sum())
+        gross_loss = abs(float(losers.sum())) if len(losers) else 1
         profit_factor = gross_profit / gross_loss if gross_loss > 0 else 0
     else:
         win_rate = 0
@@ -105,7 +133,6 @@ def calculate_metrics(
         largest_winner = 0
         largest_loser = 0
         profit_factor = 0
-        total_trades = 0
 
     return PerformanceMetrics(
         total_return=total_return,
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime
 from typing import Any
 
+import numpy as np
+
 from pmbacktest.types import (
     Fill,
     Outcome,
@@ -35,21 +36,77 @@ class PortfolioManager:
         positions: Dict of position_key -> Position
     """
 
-    def __init__(self, initial_cash: float = 10000.0):
+    def __init__(self, initial_cash: float = 10000.0, expected_bars: int = 0):
         """Initialize portfolio with starting capital.
 
         Args:
             initial_cash: Starting cash amount
+            expected_bars: Expected number of record_equity calls;
+                when > 0 the equity curve is preallocated up front
+                (the engine also reserves via reserve_history)
         """
         self.initial_cash = initial_cash
         self.cash = initial_cash
-        self.positions: dict[str, Position] = {}
+        self.positions: dict[tuple[str, Outcome], Position] = {}
+        # Structure-of-arrays mirror of the numeric Position fields,
+        # indexed by slot id (see _alloc_slot). Equity and P&L totals
+        # reduce over these arrays instead of walking dataclasses.
+        self._pos_slot: dict[tuple[str, Outcome], int] = {}
+        self._qty = np.zeros(128)
+        self._entry_px = np.zeros(128)
+        self._unreal = np.zeros(128)
+        self._realized = np.zeros(128)
+        self._px_scratch = np.zeros(128)
+        self._n_slots = 0
+        self._free_slots: list[int] = []
+        # Running scalars so total_equity is O(1) per access; kept in
+        # step by execute_buy/execute_sell and refreshed exactly from
+        # the SoA buffers in mark_to_market
+        self._invested_cost = 0.0
+        self._unreal_sum = 0.0
         self._trades: list[Trade] = []
         self._equity_history: list[tuple[int, float]] = []
+        # Preallocated equity curve (see reserve_history); falls back
+        # to the tuple list when capacity is unknown or exhausted
+        self._equity_ts: np.ndarray | None = None
+        self._equity_val: np.ndarray | None = None
+        self._equity_len = 0
+        if expected_bars > 0:
+            self.reserve_history(expected_bars)
+
+    def _make_key(self, market_id: str, outcome: Outcome) -> tuple[str, Outcome]:
+        """Create position key from market and outcome.
+
+        Tuples of interned strings and enum members hash faster than
+        formatting an f-string key per lookup.
+        """
+        return (market_id, outcome)
 
-    def _make_key(self, market_id: str, outcome: Outcome) -> str:
-        """Create position key from market and outcome."""
-        return f"{market_id}:{outcome.value}"
+    def _alloc_slot(self, key: tuple[str, Outcome]) -> int:
+        """Allocate an SoA slot for a new position, growing x2 on demand."""
+        if self._free_slots:
+            slot = self._free_slots.pop()
+        else:
+            slot = self._n_slots
+            if slot == len(self._qty):
+                for name in ("_qty", "_entry_px", "_unreal", "_realized", "_px_scratch"):
+                    arr = getattr(self, name)
+                    grown = np.zeros(len(arr) * 2)
+                    grown[: len(arr)] = arr
+                    setattr(self, name, grown)
+            self._n_slots = slot + 1
+        self._pos_slot[key] = slot
+        return slot
+
+    def _free_slot(self, key: tuple[str, Outcome]) -> None:
+        """Release a closed position's slot for reuse."""
+        slot = self._pos_slot.pop(key)
+        self._unreal_sum -= float(self._unreal[slot])
+        self._qty[slot] = 0.0
+        self._entry_px[slot] = 0.0
+        self._unreal[slot] = 0.0
+        self._realized[slot] = 0.0
+        self._free_slots.append(slot)
 
     @property
     def trades(self) -> list[Trade]:
@@ -59,25 +116,31 @@ class PortfolioManager:
     @property
     def equity_history(self) -> list[tuple[int, float]]:
         """Get equity curve as (timestamp, equity) pairs."""
-        return self._equity_history
+        if self._equity_ts is None or self._equity_len == 0:
+            return self._equity_history
+        n = self._equity_len
+        recorded = list(
+            zip(self._equity_ts[:n].tolist(), self._equity_val[:n].tolist(), strict=True)
+        )
+        # Overflow entries (recorded past the reserved capacity) live
+        # in the tuple list
+        return recorded + self._equity_history
 
     @property
     def total_unrealized_pnl(self) -> float:
         """Sum of all unrealized P&L."""
-        return sum(p.unrealized_pnl for p in self.positions.values())
+        return self._unreal_sum
 
     @property
     def total_realized_pnl(self) -> float:
         """Sum of all realized P&L."""
-        return sum(p.realized_pnl for p in self.positions.values())
+        return float(self._realized[: self._n_slots].sum())
 
     @property
     def total_equity(self) -> float:
         """Total portfolio value including cash and positions."""
-        return self.cash + sum(
-            p.quantity * p.entry_price  # Use cost basis for unrealized
-            for p in self.positions.values()
-        ) + self.total_unrealized_pnl
+        # Cost basis plus unrealized, maintained incrementally
+        return self.cash + self._invested_cost + self._unreal_sum
 
     def get_position(self, market_id: str, outcome: Outcome) -> Position | None:
         """Get position for a market outcome."""
@@ -137,14 +200,21 @@ class PortfolioManager:
             )
             pos.quantity = total_qty
             pos.entry_price = new_entry_price
+            slot = self._pos_slot[key]
+            self._qty[slot] = total_qty
+            self._entry_px[slot] = new_entry_price
         else:
             self.positions[key] = Position(
                 market_id=market_id,
                 outcome=outcome,
                 quantity=token_amount,
                 entry_price=fill_price,
-                entry_time=datetime.fromtimestamp(timestamp) if timestamp else datetime.now(),
+                entry_time=timestamp,
             )
+            slot = self._alloc_slot(key)
+            self._qty[slot] = token_amount
+            self._entry_px[slot] = fill_price
+        self._invested_cost += cost
 
         from pmbacktest.types import Order, OrderType
 
@@ -159,7 +229,7 @@ class PortfolioManager:
             side=OrderSide.BUY,
             quantity=token_amount,
             price=fill_price,
-            timestamp=datetime.fromtimestamp(timestamp) if timestamp else datetime.now(),
+            timestamp=timestamp,
         )
 
         return fill
@@ -171,15 +241,18 @@ class PortfolioManager:
         dollar_amount: float,
         fill_price: float,
         timestamp: int | None = None,
+        *,
+        sell_all: bool = False,
     ) -> Fill | None:
         """Execute a sell order (close or reduce position).
 
         Args:
             market_id: Market identifier
             outcome: Which outcome to sell
-            dollar_amount: Dollar amount to sell (or 'all' for full position)
+            dollar_amount: Dollar amount to sell (ignored if sell_all)
             fill_price: Price at which order filled
             timestamp: Order timestamp
+            sell_all: Sell the full position regardless of dollar_amount
 
         Returns:
             Fill object if successful, None if no position
@@ -193,7 +266,7 @@ class PortfolioManager:
             return None
 
         # Calculate how many tokens to sell
-        if dollar_amount == -1:  # Sell all
+        if sell_all:
             token_amount = pos.quantity
         else:
             token_amount = min(dollar_amount / fill_price, pos.quantity)
@@ -208,6 +281,10 @@ class PortfolioManager:
         # Update or remove position
         pos.quantity -= token_amount
         self.cash += proceeds
+        slot = self._pos_slot[key]
+        self._qty[slot] = pos.quantity
+        self._realized[slot] = pos.realized_pnl
+        self._invested_cost -= cost_basis
 
         # Record trade
         trade = Trade(
@@ -218,13 +295,14 @@ class PortfolioManager:
             price=fill_price,
             pnl=trade_pnl,
             entry_time=pos.entry_time,
-            exit_time=datetime.fromtimestamp(timestamp) if timestamp else datetime.now(),
+            exit_time=timestamp,
         )
         self._trades.append(trade)
 
         # Remove position if fully closed
         if pos.quantity <= 0:
             del self.positions[key]
+            self._free_slot(key)
 
         from pmbacktest.types import Order
 
@@ -239,7 +317,7 @@ class PortfolioManager:
             side=OrderSide.SELL,
             quantity=token_amount,
             price=fill_price,
-            timestamp=datetime.fromtimestamp(timestamp) if timestamp else datetime.now(),
+            timestamp=timestamp,
         )
 
         return fill
@@ -250,11 +328,47 @@ class PortfolioManager:
         Args:
             prices: Dict of market_id -> {outcome: price}
         """
-        for key, pos in list(self.positions.items()):
-            market_prices = prices.get(pos.market_id, {})
-            current_price = market_prices.get(pos.outcome)
-            if current_price is not None:
-                pos.update_unrealized_pnl(current_price)
+        slots = self._pos_slot
+        if not slots:
+            return
+        n = self._n_slots
+        scratch = self._px_scratch
+        scratch[:n] = np.nan
+        # Gather current prices into slot order; the arithmetic below
+        # is then a single vector op over the SoA buffers
+        for (market_id, outcome), slot in slots.items():
+            market_prices = prices.get(market_id)
+            if market_prices is not None:
+                price = market_prices.get(outcome)
+                if price is not None:
+                    scratch[slot] = price
+        px = scratch[:n]
+        mask = ~np.isnan(px)
+        unreal = self._unreal
+        np.copyto(unreal[:n], self._qty[:n] * (px - self._entry_px[:n]), where=mask)
+        self._unreal_sum = float(unreal[:n].sum())
+        # Keep the public dataclasses in step with the SoA values.
+        # tolist() converts to Python floats in one pass so downstream
+        # scalar arithmetic doesn't fall into numpy ufunc dispatch
+        vals = unreal[:n].tolist()
+        positions = self.positions
+        for key, slot in slots.items():
+            positions[key].unrealized_pnl = vals[slot]
+
+    def reserve_history(self, capacity: int) -> None:
+        """Preallocate the equity curve for a known number of bars.
+
+        Avoids allocating a (timestamp, equity) tuple per bar; the
+        engine calls this with the feed length before running.
+
+        Args:
+            capacity: Expected number of record_equity calls
+        """
+        # Preserve anything already recorded before re-reserving
+        self._equity_history = self.equity_history
+        self._equity_ts = np.empty(capacity, dtype=np.int64)
+        self._equity_val = np.empty(capacity, dtype=np.float64)
+        self._equity_len = 0
 
     def record_equity(self, timestamp: int) -> None:
         """Record equity for equity curve.
@@ -262,7 +376,13 @@ class PortfolioManager:
         Args:
             timestamp: Current timestamp
         """
-        self._equity_history.append((timestamp, self.total_equity))
+        if self._equity_ts is not None and self._equity_len < len(self._equity_ts):
+            i = self._equity_len
+            self._equity_ts[i] = timestamp
+            self._equity_val[i] = self.total_equity
+            self._equity_len = i + 1
+        else:
+            self._equity_history.append((timestamp, self.total_equity))
 
     def close_position(
         self,
@@ -282,7 +402,9 @@ class PortfolioManager:
         Returns:
             Fill object if position was closed, None if no position
         """
-        return self.execute_sell(market_id, outcome, -1, close_price, timestamp)
+        return self.execute_sell(
+            market_id, outcome, 0.0, close_price, timestamp, sell_all=True
+        )
 
     def get_state(self) -> PortfolioState:
         """Get current portfolio state."""
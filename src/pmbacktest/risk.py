@@ -5,7 +5,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from enum import StrEnum
 
-from pmbacktest.types import Signal
+from pmbacktest.types import OrderSide, Signal
+
+# Enum members are singletons; identity compare against this constant
+# is a single pointer check in the per-tick stop-loss path
+_BUY = OrderSide.BUY
 
 
 class PositionSizingMethod(StrEnum):
@@ -17,6 +21,61 @@ class PositionSizingMethod(StrEnum):
     FRACTIONAL_KELLY = "fractional_kelly"
 
 
+# Integer method ids for the scalar sizing core
+_SIZING_IDS = {
+    PositionSizingMethod.FIXED_AMOUNT: 0,
+    PositionSizingMethod.FIXED_PERCENT: 1,
+    PositionSizingMethod.KELLY: 2,
+    PositionSizingMethod.FRACTIONAL_KELLY: 3,
+}
+
+
+def _size_core(
+    method_id: int,
+    portfolio_value: float,
+    fixed_amount: float,
+    fixed_percent: float,
+    max_kelly: float,
+    win_rate: float,
+    avg_win: float,
+    avg_loss: float,
+) -> float:
+    """Scalar position-sizing core dispatched on an int method id.
+
+    Called per signal; operates on primitive floats with no enum
+    comparisons so the per-tick cost is plain arithmetic.
+
+    Args:
+        method_id: Sizing method (see _SIZING_IDS)
+        portfolio_value: Current portfolio value
+        fixed_amount: Dollar amount for fixed-amount sizing
+        fixed_percent: Portfolio fraction for fixed-percent sizing
+        max_kelly: Kelly fraction cap for fractional Kelly
+        win_rate: Historical win rate (for Kelly)
+        avg_win: Average win amount (for Kelly)
+        avg_loss: Average loss amount (for Kelly)
+
+    Returns:
+        Dollar amount to trade
+    """
+    if method_id == 0:
+        return fixed_amount
+    if method_id == 1:
+        return portfolio_value * fixed_percent
+
+    # Kelly: f* = (bp - q) / b, clamped to [0, 1]
+    if avg_loss == 0:
+        kelly = 0.0
+    else:
+        b = avg_win / avg_loss
+        kelly = (b * win_rate - (1 - win_rate)) / b
+        kelly = max(0.0, min(1.0, kelly))
+
+    if method_id == 3:
+        kelly *= max_kelly
+    return portfolio_value * kelly
+
+
 @dataclass
 class RiskConfig:
     """Configuration for risk management."""
@@ -45,6 +104,9 @@ class RiskManager:
             config: Risk configuration
         """
         self.config = config or RiskConfig()
+        # Resolve the sizing method to an int id once; unknown
+        # methods fall back to fixed amount
+        self._method_id = _SIZING_IDS.get(self.config.position_sizing, 0)
         self._daily_pnl = 0.0
         self._day_start_equity = 0.0
 
@@ -68,24 +130,17 @@ class RiskManager:
         Returns:
             Adjusted dollar amount to trade
         """
-        method = self.config.position_sizing
-
-        if method == PositionSizingMethod.FIXED_AMOUNT:
-            return self.config.fixed_amount
-
-        elif method == PositionSizingMethod.FIXED_PERCENT:
-            return portfolio_value * self.config.fixed_percent
-
-        elif method == PositionSizingMethod.KELLY:
-            kelly = self._calculate_kelly(win_rate, avg_win, avg_loss)
-            return portfolio_value * kelly
-
-        elif method == PositionSizingMethod.FRACTIONAL_KELLY:
-            kelly = self._calculate_kelly(win_rate, avg_win, avg_loss)
-            fractional = kelly * self.config.max_kelly
-            return portfolio_value * fractional
-
-        return self.config.fixed_amount  # Default
+        config = self.config
+        return _size_core(
+            self._method_id,
+            portfolio_value,
+            config.fixed_amount,
+            config.fixed_percent,
+            config.max_kelly,
+            win_rate,
+            avg_win,
+            avg_loss,
+        )
 
     def _calculate_kelly(
         self,
@@ -172,7 +227,7 @@ class RiskManager:
         if not self.config.enable_stop_loss:
             return False
 
-        if signal.action.value == "buy":
+        if signal.action is _BUY:
             # For long positions, stop loss is below entry
             loss_pct = (entry_price - current_price) / entry_price
             return loss_pct >= self.config.stop_loss_pct
@@ -11,7 +11,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from typing import Any, NamedTuple
 
 from pmbacktest.types import (
     Fill,
@@ -24,7 +24,7 @@ from pmbacktest.types import (
 Orderbook = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Bar:
     """A single bar of price data.
 
@@ -45,7 +45,23 @@ class Bar:
     volume: float
 
 
-@dataclass
+class BarsSoA(NamedTuple):
+    """All bars for a backtest as columns (struct-of-arrays).
+
+    Each field is a NumPy array: timestamp has shape (T,) and the
+    price/volume columns have shape (T, M) with markets ordered as in
+    the feed. Passed to SignalStrategy.on_bars_batch.
+    """
+
+    timestamp: Any
+    open: Any
+    high: Any
+    low: Any
+    close: Any
+    volume: Any
+
+
+@dataclass(slots=True)
 class MarketState:
     """Current state of markets for strategy decision-making.
 
@@ -102,6 +118,17 @@ class Strategy(ABC):
         """
         pass
 
+    @property
+    def subscribed_markets(self) -> set[str] | None:
+        """Markets this strategy wants bars for.
+
+        Returns None (the default) to receive every bar. Subclasses
+        watching a subset of a wide feed can return a set of market
+        ids; the engine then skips on_bar calls for data points that
+        carry no data for any subscribed market.
+        """
+        return None
+
     @abstractmethod
     def on_bar(self, state: MarketState) -> list[Signal] | None:
         """Called on each bar of data.
@@ -114,6 +141,37 @@ class Strategy(ABC):
         """
         pass
 
+    def vectorize(
+        self,
+        timestamps: Any,
+        opens: Any,
+        highs: Any,
+        lows: Any,
+        closes: Any,
+        volumes: Any,
+    ) -> Any | None:
+        """Optionally evaluate the whole backtest period in one call.
+
+        Strategies whose signals depend only on bar data (no feedback
+        from fills or portfolio state) can override this to compute all
+        signals in a single vectorized pass. The engine then skips the
+        per-bar on_bar call for this strategy.
+
+        Args:
+            timestamps: int64 array of shape (T,)
+            opens: float32 array of shape (T, M)
+            highs: float32 array of shape (T, M)
+            lows: float32 array of shape (T, M)
+            closes: float32 array of shape (T, M)
+            volumes: float32 array of shape (T, M)
+
+        Returns:
+            Integer array of shape (T, M) with side codes per bar and
+            market (+1 buy YES, -1 sell YES, 0 no action), or None to
+            use per-bar on_bar evaluation (the default).
+        """
+        return None
+
     def on_fill(self, fill: Fill) -> None:
         """Called when an order is filled.
 
@@ -163,6 +221,45 @@ class SignalStrategy(Strategy):
         """
         return self.generate_signals(state)
 
+    def on_bars_batch(self, bars: BarsSoA) -> Any | None:
+        """Optionally evaluate all bars in one vectorized pass.
+
+        Indicator strategies whose signals depend only on bar data
+        (SMA, RSI, momentum, ...) can override this to compute every
+        signal in a single NumPy pass over the bar columns; the engine
+        then skips per-bar generate_signals calls for this strategy.
+
+        Args:
+            bars: Bar columns for the whole backtest
+
+        Returns:
+            Integer array of shape (T, M) with side codes per bar and
+            market (+1 buy YES, -1 sell YES, 0 no action), or None to
+            use per-bar evaluation (the default).
+        """
+        return None
+
+    def vectorize(
+        self,
+        timestamps: Any,
+        opens: Any,
+        highs: Any,
+        lows: Any,
+        closes: Any,
+        volumes: Any,
+    ) -> Any | None:
+        """Route the engine's vectorized path through on_bars_batch.
+
+        Only engages when a subclass actually overrides on_bars_batch;
+        otherwise returns None so the engine falls back to per-bar
+        evaluation.
+        """
+        if type(self).on_bars_batch is SignalStrategy.on_bars_batch:
+            return None
+        return self.on_bars_batch(
+            BarsSoA(timestamps, opens, highs, lows, closes, volumes)
+        )
+
     @abstractmethod
     def generate_signals(self, state: MarketState) -> list[Signal] | None:
         """Generate trading signals based on market state.
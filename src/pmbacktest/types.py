@@ -31,7 +31,16 @@ class Outcome(StrEnum):
     NO = "no"
 
 
-@dataclass
+# Integer codes attached to the enum members for hot paths that want
+# array indexing or sign arithmetic instead of hashing/string compares.
+# The StrEnum values remain the public, serialized representation.
+OrderSide.BUY.sign = 1
+OrderSide.SELL.sign = -1
+Outcome.YES.index = 0
+Outcome.NO.index = 1
+
+
+@dataclass(slots=True)
 class Signal:
     """Trading signal generated by a strategy.
 
@@ -54,7 +63,7 @@ class Signal:
     stop_price: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """An order ready for execution.
 
@@ -71,7 +80,7 @@ class Order:
     filled_at: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """A position in a market outcome.
 
@@ -80,7 +89,7 @@ class Position:
         outcome: Which outcome (yes or no)
         quantity: Number of tokens held
         entry_price: Price at which position was entered
-        entry_time: When the position was entered
+        entry_time: Entry timestamp (epoch seconds)
         unrealized_pnl: Current unrealized profit/loss
         realized_pnl: Realized profit/loss from closed trades
     """
@@ -89,26 +98,34 @@ class Position:
     outcome: Outcome
     quantity: float
     entry_price: float
-    entry_time: datetime = field(default_factory=datetime.now)
+    entry_time: int | None = None
     unrealized_pnl: float = 0.0
     realized_pnl: float = 0.0
 
+    @property
+    def entry_time_dt(self) -> datetime | None:
+        """Entry time as a datetime, converted on demand."""
+        return datetime.fromtimestamp(self.entry_time) if self.entry_time else None
+
     @property
     def cost_basis(self) -> float:
         """Total cost of the position."""
         return self.quantity * self.entry_price
 
-    @property
     def current_value(self, current_price: float) -> float:
         """Current value of the position given a price."""
         return self.quantity * current_price
 
     def update_unrealized_pnl(self, current_price: float) -> None:
-        """Update unrealized P&L based on current price."""
-        self.unrealized_pnl = self.current_value(current_price) - self.cost_basis
+        """Update unrealized P&L based on current price.
+
+        Kept for external callers; the portfolio's mark-to-market
+        path computes this vectorized over all positions instead.
+        """
+        self.unrealized_pnl = self.quantity * (current_price - self.entry_price)
 
 
-@dataclass
+@dataclass(slots=True)
 class Fill:
     """Record of an order execution.
 
@@ -120,7 +137,7 @@ class Fill:
         quantity: Number of tokens filled
         price: Fill price
         commission: Commission/fee paid
-        timestamp: When the fill occurred
+        timestamp: Fill timestamp (epoch seconds)
     """
 
     order: Order
@@ -130,15 +147,20 @@ class Fill:
     quantity: float
     price: float
     commission: float = 0.0
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: int | None = None
 
     @property
     def total_cost(self) -> float:
         """Total cost including commission."""
         return self.quantity * self.price + self.commission
 
+    @property
+    def timestamp_dt(self) -> datetime | None:
+        """Fill time as a datetime, converted on demand."""
+        return datetime.fromtimestamp(self.timestamp) if self.timestamp else None
+
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     """Completed trade record for history.
 
@@ -149,8 +171,8 @@ class Trade:
         quantity: Number of tokens
         price: Trade price
         pnl: Profit/loss from this trade
-        entry_time: When position was opened
-        exit_time: When position was closed
+        entry_time: Entry timestamp (epoch seconds)
+        exit_time: Exit timestamp (epoch seconds)
         commission: Total commission paid
     """
 
@@ -160,10 +182,20 @@ class Trade:
     quantity: float
     price: float
     pnl: float = 0.0
-    entry_time: datetime = field(default_factory=datetime.now)
-    exit_time: datetime = field(default_factory=datetime.now)
+    entry_time: int | None = None
+    exit_time: int | None = None
     commission: float = 0.0
 
+    @property
+    def entry_time_dt(self) -> datetime | None:
+        """Entry time as a datetime, converted on demand."""
+        return datetime.fromtimestamp(self.entry_time) if self.entry_time else None
+
+    @property
+    def exit_time_dt(self) -> datetime | None:
+        """Exit time as a datetime, converted on demand."""
+        return datetime.fromtimestamp(self.exit_time) if self.exit_time else None
+
 
 # Type alias for fee calculation functions
 FeeCalculator = Callable[[float, float, bool], float]
@@ -1,4 +1,4 @@
 from pmdata._version import __version__
-from pmdata.client import PolymarketData
+from pmdata.client import MarketNotFoundError, PolymarketData, warm_cache
 
-__all__ = ["PolymarketData", "__version__"]
+__all__ = ["MarketNotFoundError", "PolymarketData", "__version__", "warm_cache"]
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import os
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import httpx
@@ -15,36 +19,86 @@ _BOOK_LIMIT = 1500
 _WINDOW_SECS = 10.0
 
 
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
 def _is_retryable(exc: BaseException) -> bool:
     if isinstance(exc, httpx.HTTPStatusError):
-        return exc.response.status_code in {429, 500, 502, 503, 504}
+        return exc.response.status_code in _RETRYABLE_STATUS
     return isinstance(exc, (httpx.TimeoutException, httpx.ConnectError, httpx.NetworkError))
 
 
 _MAX_WINDOW_SECS = 14 * 86400  # API enforces ~15-day max; use 14 to be safe
+_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=30.0)
+_HEADERS = {"Accept-Encoding": "gzip"}
+
+
+def _price_params(
+    token_id: str,
+    start_ts: int | None,
+    end_ts: int | None,
+    interval: Interval | None,
+    fidelity: int,
+) -> dict[str, Any]:
+    params: dict[str, Any] = {"market": token_id, "fidelity": fidelity}
+    if start_ts is not None:
+        params["startTs"] = start_ts
+    if end_ts is not None:
+        params["endTs"] = end_ts
+    if interval is not None:
+        params["interval"] = interval.value
+    return params
+
+
+def _parse_levels(raw: list[dict]) -> list[OrderbookLevel]:
+    """Build orderbook levels without per-level pydantic validation."""
+    construct = OrderbookLevel.model_construct
+    return [construct(price=float(lvl["price"]), size=float(lvl["size"])) for lvl in raw]
+
+
+def _parse_history(payload: dict[str, Any]) -> list[PricePoint]:
+    """Build PricePoints from a /prices-history payload.
+
+    Uses model_construct to skip per-point pydantic validation; the
+    payload values are already int/float from the JSON decode, and at
+    fidelity=1 a 14-day window is ~20k points per response.
+    """
+    construct = PricePoint.model_construct
+    return [construct(t=item["t"], p=item["p"]) for item in payload.get("history", [])]
 
 
 class ClobClient:
     def __init__(self, timeout: float = 30.0) -> None:
-        self._client = httpx.Client(base_url=_CLOB_BASE, timeout=timeout)
-        self._price_times: list[float] = []
-        self._book_times: list[float] = []
+        self._timeout = timeout
+        self._client = httpx.Client(
+            base_url=_CLOB_BASE, timeout=timeout, limits=_LIMITS, headers=_HEADERS
+        )
+        self._price_times: deque[float] = deque()
+        self._book_times: deque[float] = deque()
+        self._throttle_lock = threading.Lock()
+
+    def _throttle(self, bucket: deque[float], limit: int, window: float) -> None:
+        while True:
+            with self._throttle_lock:
+                now = time.monotonic()
+                while bucket and now - bucket[0] >= window:
+                    bucket.popleft()
+                if len(bucket) < limit:
+                    bucket.append(now)
+                    return
+                wait = max(0.001, bucket[0] + window - now)
+            time.sleep(wait)
 
-    def _throttle(self, bucket: list[float], limit: int, window: float) -> None:
+    async def _athrottle(self, bucket: deque[float], limit: int, window: float) -> None:
         while True:
             now = time.monotonic()
             while bucket and now - bucket[0] >= window:
-                bucket.pop(0)
+                bucket.popleft()
             if len(bucket) < limit:
                 bucket.append(now)
                 return
-            time.sleep(max(0.001, bucket[0] + window - now))
+            await asyncio.sleep(max(0.001, bucket[0] + window - now))
 
-    @retry(
-        stop=stop_after_attempt(5),
-        wait=wait_exponential(multiplier=1, min=1, max=30),
-        retry=retry_if_exception(_is_retryable),
-    )
     def get_prices_history(
         self,
         token_id: str,
@@ -64,15 +118,24 @@ class ClobClient:
         end_ts: int,
         fidelity: int,
     ) -> list[PricePoint]:
-        all_points: list[PricePoint] = []
+        """Fetch a long window as parallel _MAX_WINDOW_SECS chunks.
+
+        httpx.Client is thread-safe and the chunks are independent, so
+        the request RTTs overlap across a small worker pool; map()
+        keeps the results in chunk order.
+        """
+        chunks: list[tuple[int, int]] = []
         chunk_start = start_ts
         while chunk_start < end_ts:
             chunk_end = min(chunk_start + _MAX_WINDOW_SECS, end_ts)
-            all_points.extend(
-                self._get_prices_history_single(token_id, chunk_start, chunk_end, None, fidelity)
-            )
+            chunks.append((chunk_start, chunk_end))
             chunk_start = chunk_end
-        return all_points
+        with ThreadPoolExecutor(max_workers=min(8, len(chunks))) as executor:
+            pages = executor.map(
+                lambda c: self._get_prices_history_single(token_id, c[0], c[1], None, fidelity),
+                chunks,
+            )
+            return [point for page in pages for point in page]
 
     @retry(
         stop=stop_after_attempt(5),
@@ -88,16 +151,92 @@ class ClobClient:
         fidelity: int = 1,
     ) -> list[PricePoint]:
         self._throttle(self._price_times, _PRICES_LIMIT, _WINDOW_SECS)
-        params: dict[str, Any] = {"market": token_id, "fidelity": fidelity}
-        if start_ts is not None:
-            params["startTs"] = start_ts
-        if end_ts is not None:
-            params["endTs"] = end_ts
-        if interval is not None:
-            params["interval"] = interval.value
+        params = _price_params(token_id, start_ts, end_ts, interval, fidelity)
         resp = self._client.get("/prices-history", params=params)
         resp.raise_for_status()
-        return [PricePoint(t=item["t"], p=item["p"]) for item in resp.json().get("history", [])]
+        return _parse_history(resp.json())
+
+    def get_prices_history_batch(
+        self,
+        token_ids: list[str],
+        start_ts: int | None = None,
+        end_ts: int | None = None,
+        interval: Interval | None = None,
+        fidelity: int = 1,
+        max_concurrency: int = 8,
+    ) -> dict[str, list[PricePoint]]:
+        """Fetch price history for many tokens concurrently.
+
+        Overlaps request latency across tokens over one AsyncClient
+        while sharing the sync client's rate-limit bucket; windows
+        longer than the API maximum are chunked per token like
+        get_prices_history. Returns token_id -> points.
+        """
+        return asyncio.run(
+            self._batch_prices_history(
+                token_ids, start_ts, end_ts, interval, fidelity, max_concurrency
+            )
+        )
+
+    async def _batch_prices_history(
+        self,
+        token_ids: list[str],
+        start_ts: int | None,
+        end_ts: int | None,
+        interval: Interval | None,
+        fidelity: int,
+        max_concurrency: int,
+    ) -> dict[str, list[PricePoint]]:
+        sem = asyncio.Semaphore(max_concurrency)
+        async with httpx.AsyncClient(
+            base_url=_CLOB_BASE, timeout=self._timeout, limits=_LIMITS, headers=_HEADERS
+        ) as client:
+
+            async def fetch_one(token_id: str) -> list[PricePoint]:
+                if (
+                    start_ts is not None
+                    and end_ts is not None
+                    and (end_ts - start_ts) > _MAX_WINDOW_SECS
+                ):
+                    points: list[PricePoint] = []
+                    chunk_start = start_ts
+                    while chunk_start < end_ts:
+                        chunk_end = min(chunk_start + _MAX_WINDOW_SECS, end_ts)
+                        points.extend(
+                            await self._afetch_prices_single(
+                                client, sem, token_id, chunk_start, chunk_end, None, fidelity
+                            )
+                        )
+                        chunk_start = chunk_end
+                    return points
+                return await self._afetch_prices_single(
+                    client, sem, token_id, start_ts, end_ts, interval, fidelity
+                )
+
+            results = await asyncio.gather(*(fetch_one(t) for t in token_ids))
+        return dict(zip(token_ids, results, strict=True))
+
+    @retry(
+        stop=stop_after_attempt(5),
+        wait=wait_exponential(multiplier=1, min=1, max=30),
+        retry=retry_if_exception(_is_retryable),
+    )
+    async def _afetch_prices_single(
+        self,
+        client: httpx.AsyncClient,
+        sem: asyncio.Semaphore,
+        token_id: str,
+        start_ts: int | None,
+        end_ts: int | None,
+        interval: Interval | None,
+        fidelity: int,
+    ) -> list[PricePoint]:
+        async with sem:
+            await self._athrottle(self._price_times, _PRICES_LIMIT, _WINDOW_SECS)
+            params = _price_params(token_id, start_ts, end_ts, interval, fidelity)
+            resp = await client.get("/prices-history", params=params)
+        resp.raise_for_status()
+        return _parse_history(resp.json())
 
     @retry(
         stop=stop_after_attempt(5),
@@ -113,14 +252,8 @@ class ClobClient:
             timestamp=int(data.get("timestamp", int(time.time()))),
             market=data.get("market", ""),
             token_id=token_id,
-            bids=[
-                OrderbookLevel(price=float(b["price"]), size=float(b["size"]))
-                for b in data.get("bids", [])
-            ],
-            asks=[
-                OrderbookLevel(price=float(a["price"]), size=float(a["size"]))
-                for a in data.get("asks", [])
-            ],
+            bids=_parse_levels(data.get("bids", [])),
+            asks=_parse_levels(data.get("asks", [])),
             is_synthetic=False,
         )
 
@@ -1,40 +1,96 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import time
-from typing import Any
+from collections import deque
+from typing import TYPE_CHECKING, Any
 
 import httpx
 from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 
 from pmdata.models import Market
 
+if TYPE_CHECKING:
+    from pmdata.cache.impl import SQLiteMetadataCache
+
 _GAMMA_BASE = os.getenv("PMDATA_GAMMA_BASE_URL", "https://gamma-api.polymarket.com")
 _MARKETS_LIMIT = 300
 _WINDOW_SECS = 10.0
+_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=30.0)
+_HEADERS = {"Accept-Encoding": "gzip"}
+
+
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
 
 
 def _is_retryable(exc: BaseException) -> bool:
     if isinstance(exc, httpx.HTTPStatusError):
-        return exc.response.status_code in {429, 500, 502, 503, 504}
+        return exc.response.status_code in _RETRYABLE_STATUS
     return isinstance(exc, (httpx.TimeoutException, httpx.ConnectError, httpx.NetworkError))
 
 
+def _markets_params(
+    active: bool | None,
+    closed: bool | None,
+    limit: int,
+    offset: int,
+    order: str | None,
+    ascending: bool | None,
+    start_date_min: str | None,
+    start_date_max: str | None,
+) -> dict[str, Any]:
+    params: dict[str, Any] = {"limit": limit, "offset": offset}
+    if active is not None:
+        params["active"] = str(active).lower()
+    if closed is not None:
+        params["closed"] = str(closed).lower()
+    if order is not None:
+        params["order"] = order
+    if ascending is not None:
+        params["ascending"] = str(ascending).lower()
+    if start_date_min is not None:
+        params["start_date_min"] = start_date_min
+    if start_date_max is not None:
+        params["start_date_max"] = start_date_max
+    return params
+
+
 class GammaClient:
-    def __init__(self, timeout: float = 30.0) -> None:
-        self._client = httpx.Client(base_url=_GAMMA_BASE, timeout=timeout)
-        self._request_times: list[float] = []
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        cache: SQLiteMetadataCache | None = None,
+        cache_ttl: float = 3600.0,
+    ) -> None:
+        self._timeout = timeout
+        self._client = httpx.Client(
+            base_url=_GAMMA_BASE, timeout=timeout, limits=_LIMITS, headers=_HEADERS
+        )
+        self._request_times: deque[float] = deque()
+        self._cache = cache
+        self._cache_ttl = cache_ttl
 
     def _throttle(self) -> None:
         while True:
             now = time.monotonic()
             while self._request_times and now - self._request_times[0] >= _WINDOW_SECS:
-                self._request_times.pop(0)
+                self._request_times.popleft()
             if len(self._request_times) < _MARKETS_LIMIT:
                 self._request_times.append(now)
                 return
             time.sleep(max(0.001, self._request_times[0] + _WINDOW_SECS - now))
 
+    async def _athrottle(self) -> None:
+        while True:
+            now = time.monotonic()
+            while self._request_times and now - self._request_times[0] >= _WINDOW_SECS:
+                self._request_times.popleft()
+            if len(self._request_times) < _MARKETS_LIMIT:
+                self._request_times.append(now)
+                return
+            await asyncio.sleep(max(0.001, self._request_times[0] + _WINDOW_SECS - now))
+
     def _build_market(self, raw: dict[str, Any]) -> Market:
         return Market(
             id=str(raw.get("id", "")),
@@ -68,33 +124,39 @@ class GammaClient:
         start_date_max: str | None = None,
     ) -> list[Market]:
         self._throttle()
-        params: dict[str, Any] = {"limit": limit, "offset": offset}
-        if active is not None:
-            params["active"] = str(active).lower()
-        if closed is not None:
-            params["closed"] = str(closed).lower()
-        if order is not None:
-            params["order"] = order
-        if ascending is not None:
-            params["ascending"] = str(ascending).lower()
-        if start_date_min is not None:
-            params["start_date_min"] = start_date_min
-        if start_date_max is not None:
-            params["start_date_max"] = start_date_max
+        params = _markets_params(
+            active, closed, limit, offset, order, ascending, start_date_min, start_date_max
+        )
         resp = self._client.get("/markets", params=params)
         resp.raise_for_status()
         return [self._build_market(m) for m in resp.json()]
 
+    def get_market(self, market_id: str) -> Market:
+        """Fetch one market, served from the metadata cache when fresh.
+
+        With an injected cache, raw payloads younger than cache_ttl
+        short-circuit the throttle, network round trip, and JSON parse
+        that repeated lookups of hot markets would otherwise pay.
+        """
+        if self._cache is not None:
+            cached = self._cache.load_market_with_ts(market_id)
+            if cached is not None and time.time() - cached[1] < self._cache_ttl:
+                return self._build_market(cached[0])
+        return self._fetch_market(market_id)
+
     @retry(
         stop=stop_after_attempt(5),
         wait=wait_exponential(multiplier=1, min=1, max=30),
         retry=retry_if_exception(_is_retryable),
     )
-    def get_market(self, market_id: str) -> Market:
+    def _fetch_market(self, market_id: str) -> Market:
         self._throttle()
         resp = self._client.get(f"/markets/{market_id}")
         resp.raise_for_status()
-        return self._build_market(resp.json())
+        raw = resp.json()
+        if self._cache is not None:
+            self._cache.save_market(market_id, raw)
+        return self._build_market(raw)
 
     def iter_all_markets(
         self,
@@ -105,7 +167,21 @@ class GammaClient:
         ascending: bool | None = None,
         start_date_min: str | None = None,
         start_date_max: str | None = None,
+        concurrency: int = 1,
     ) -> list[Market]:
+        if concurrency > 1:
+            return asyncio.run(
+                self._iter_all_markets_async(
+                    active,
+                    closed,
+                    page_size,
+                    order,
+                    ascending,
+                    start_date_min,
+                    start_date_max,
+                    concurrency,
+                )
+            )
         all_markets: list[Market] = []
         offset = 0
         while True:
@@ -125,6 +201,81 @@ class GammaClient:
             offset += page_size
         return all_markets
 
+    async def _iter_all_markets_async(
+        self,
+        active: bool | None,
+        closed: bool | None,
+        page_size: int,
+        order: str | None,
+        ascending: bool | None,
+        start_date_min: str | None,
+        start_date_max: str | None,
+        concurrency: int,
+    ) -> list[Market]:
+        """Paginate /markets fetching `concurrency` pages per wave.
+
+        Offset pagination lets speculative pages be requested in
+        parallel; a short page anywhere in the wave ends iteration.
+        """
+        all_markets: list[Market] = []
+        offset = 0
+        async with httpx.AsyncClient(
+            base_url=_GAMMA_BASE, timeout=self._timeout, limits=_LIMITS, headers=_HEADERS
+        ) as client:
+            while True:
+                offsets = [offset + i * page_size for i in range(concurrency)]
+                pages = await asyncio.gather(
+                    *(
+                        self._aget_markets_page(
+                            client,
+                            active,
+                            closed,
+                            page_size,
+                            off,
+                            order,
+                            ascending,
+                            start_date_min,
+                            start_date_max,
+                        )
+                        for off in offsets
+                    )
+                )
+                done = False
+                for page in pages:
+                    all_markets.extend(page)
+                    if len(page) < page_size:
+                        done = True
+                        break
+                if done:
+                    break
+                offset += page_size * concurrency
+        return all_markets
+
+    @retry(
+        stop=stop_after_attempt(5),
+        wait=wait_exponential(multiplier=1, min=1, max=30),
+        retry=retry_if_exception(_is_retryable),
+    )
+    async def _aget_markets_page(
+        self,
+        client: httpx.AsyncClient,
+        active: bool | None,
+        closed: bool | None,
+        limit: int,
+        offset: int,
+        order: str | None,
+        ascending: bool | None,
+        start_date_min: str | None,
+        start_date_max: str | None,
+    ) -> list[Market]:
+        await self._athrottle()
+        params = _markets_params(
+            active, closed, limit, offset, order, ascending, start_date_min, start_date_max
+        )
+        resp = await client.get("/markets", params=params)
+        resp.raise_for_status()
+        return [self._build_market(m) for m in resp.json()]
+
     def close(self) -> None:
         self._client.close()
 
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import os
-import time
+import sys
+from collections.abc import Callable
 
-from gql import Client, gql
-from gql.transport.httpx import HTTPXTransport
+import httpx
+import numpy as np
+import pyarrow as pa
 
 from pmdata.models import Trade
 
@@ -15,7 +18,8 @@ _SUBGRAPH_URL = os.getenv(
 )
 _PAGE_SIZE = 1000
 
-_FILLS_QUERY = gql("""
+# Raw query string, POSTed directly; no per-call AST parsing.
+_FILLS_QUERY = """
     query GetFills(
         $assetId: String!,
         $startTs: BigInt!,
@@ -41,12 +45,12 @@ _FILLS_QUERY = gql("""
             takerAmountFilled
         }
     }
-""")
+"""
 
 
 def _parse_trade(event: dict, token_id: str) -> Trade | None:
     try:
-        maker_asset = str(event["makerAssetId"])
+        maker_asset = event["makerAssetId"]
         maker_amount = int(event["makerAmountFilled"])
         taker_amount = int(event["takerAmountFilled"])
         if maker_amount <= 0 or taker_amount <= 0:
@@ -73,10 +77,171 @@ def _parse_trade(event: dict, token_id: str) -> Trade | None:
         return None
 
 
+def _parse_trades_arrays(
+    events: list[dict], token_id: str
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, list[str], np.ndarray] | None:
+    """Reduce one page of orderFilledEvents to column arrays.
+
+    Computes price, size, and validity in a few array ops instead of
+    per-event int()/division/comparison. Returns (timestamps, price,
+    size, is_sell, ids, valid mask), or None if the page has malformed
+    fields and must go through the per-event parser.
+    """
+    try:
+        maker_amt = np.asarray([e["makerAmountFilled"] for e in events], dtype=np.float64)
+        taker_amt = np.asarray([e["takerAmountFilled"] for e in events], dtype=np.float64)
+        timestamps = np.asarray([e["timestamp"] for e in events], dtype=np.int64)
+        is_sell = np.asarray([e["makerAssetId"] == token_id for e in events], dtype=bool)
+        ids = [e["id"] for e in events]
+    except (KeyError, ValueError):
+        return None
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        price = np.where(is_sell, taker_amt / maker_amt, maker_amt / taker_amt)
+    size = np.where(is_sell, maker_amt, taker_amt) / 1e6
+    valid = (maker_amt > 0) & (taker_amt > 0) & (price > 0.0) & (price < 1.0)
+    return timestamps, price, size, is_sell, ids, valid
+
+
+def _parse_trades_page(events: list[dict], token_id: str) -> list[Trade]:
+    """Convert one page of orderFilledEvents with vectorized numerics.
+
+    Trade objects are only built for the valid rows; falls back to the
+    per-event parser if the page has malformed fields.
+    """
+    if not events:
+        return []
+    parsed = _parse_trades_arrays(events, token_id)
+    if parsed is None:
+        return [t for e in events if (t := _parse_trade(e, token_id)) is not None]
+    timestamps, price, size, is_sell, ids, valid = parsed
+
+    price_list = price.tolist()
+    size_list = size.tolist()
+    ts_list = timestamps.tolist()
+    sell_list = is_sell.tolist()
+    # Values off .tolist() are already native ints/floats, so skip
+    # pydantic validation with model_construct.
+    construct = Trade.model_construct
+    return [
+        construct(
+            timestamp=ts_list[i],
+            price=price_list[i],
+            size=size_list[i],
+            side="SELL" if sell_list[i] else "BUY",
+            order_id=ids[i],
+            token_id=token_id,
+        )
+        for i in np.nonzero(valid)[0].tolist()
+    ]
+
+
+_TRADES_SCHEMA = pa.schema(
+    [
+        pa.field("timestamp", pa.int64()),
+        pa.field("price", pa.float64()),
+        pa.field("size", pa.float64()),
+        pa.field("side", pa.dictionary(pa.int8(), pa.string())),
+        pa.field("order_id", pa.string()),
+        pa.field("token_id", pa.string()),
+    ]
+)
+_SIDE_DICT = pa.array(["BUY", "SELL"])
+
+
+def _page_record_batch(events: list[dict], token_id: str) -> pa.RecordBatch | None:
+    """Build one Arrow record batch from a page of orderFilledEvents."""
+    if not events:
+        return None
+    parsed = _parse_trades_arrays(events, token_id)
+    if parsed is None:
+        trades = [t for e in events if (t := _parse_trade(e, token_id)) is not None]
+        if not trades:
+            return None
+        timestamps = np.asarray([t.timestamp for t in trades], dtype=np.int64)
+        price = np.asarray([t.price for t in trades], dtype=np.float64)
+        size = np.asarray([t.size for t in trades], dtype=np.float64)
+        is_sell = np.asarray([t.side == "SELL" for t in trades], dtype=bool)
+        ids = [t.order_id for t in trades]
+        keep = np.arange(len(trades))
+    else:
+        timestamps, price, size, is_sell, ids, valid = parsed
+        if not valid.any():
+            return None
+        keep = np.nonzero(valid)[0]
+    return pa.RecordBatch.from_arrays(
+        [
+            pa.array(timestamps[keep], type=pa.int64()),
+            pa.array(price[keep], type=pa.float64()),
+            pa.array(size[keep], type=pa.float64()),
+            pa.DictionaryArray.from_arrays(
+                pa.array(is_sell[keep].astype(np.int8)), _SIDE_DICT
+            ),
+            pa.array([ids[i] for i in keep.tolist()], type=pa.string()),
+            pa.array([token_id] * len(keep), type=pa.string()),
+        ],
+        schema=_TRADES_SCHEMA,
+    )
+
+
 class SubgraphClient:
     def __init__(self, timeout: float = 60.0) -> None:
-        transport = HTTPXTransport(url=_SUBGRAPH_URL, timeout=timeout)
-        self._client = Client(transport=transport, fetch_schema_from_transport=False)
+        self._timeout = timeout
+
+    async def _fetch_pages(
+        self,
+        token_id: str,
+        start_ts: int,
+        end_ts: int,
+        handle_page: Callable[[list[dict]], None],
+    ) -> None:
+        """Paginate fills, prefetching the next page during each parse.
+
+        While handle_page reduces the current page on the CPU, the
+        request for the next page is already in flight, so network and
+        parse time overlap instead of adding up.
+        """
+        async with httpx.AsyncClient(
+            timeout=self._timeout,
+            limits=httpx.Limits(
+                max_keepalive_connections=32, max_connections=64, keepalive_expiry=30.0
+            ),
+            headers={"Accept-Encoding": "gzip"},
+        ) as client:
+
+            async def fetch(last_id: str, delay: float) -> list[dict]:
+                if delay:
+                    await asyncio.sleep(delay)
+                resp = await client.post(
+                    _SUBGRAPH_URL,
+                    json={
+                        "query": _FILLS_QUERY,
+                        "variables": {
+                            "assetId": token_id,
+                            "startTs": str(start_ts),
+                            "endTs": str(end_ts),
+                            "lastId": last_id,
+                        },
+                    },
+                )
+                resp.raise_for_status()
+                payload = resp.json()
+                if payload.get("errors"):
+                    raise RuntimeError(f"subgraph query failed: {payload['errors']}")
+                return payload.get("data", {}).get("orderFilledEvents", [])
+
+            events = await fetch("", 0.0)
+            while True:
+                prefetch = None
+                if len(events) >= _PAGE_SIZE:
+                    # The 0.1s politeness delay rides along with the
+                    # prefetch instead of blocking between pages.
+                    prefetch = asyncio.create_task(fetch(events[-1]["id"], 0.1))
+                    await asyncio.sleep(0)  # let the request go out
+                handle_page(events)
+                if prefetch is None:
+                    return
+                events = await prefetch
 
     def get_order_filled_events(
         self,
@@ -84,26 +249,36 @@ class SubgraphClient:
         start_ts: int,
         end_ts: int,
     ) -> list[Trade]:
+        # Interned so the per-event asset-id comparisons hit the
+        # pointer-equality fast path for matching pages.
+        token_id = sys.intern(token_id)
         all_trades: list[Trade] = []
-        last_id = ""
-        with self._client as session:
-            while True:
-                result = session.execute(
-                    _FILLS_QUERY,
-                    variable_values={
-                        "assetId": token_id,
-                        "startTs": str(start_ts),
-                        "endTs": str(end_ts),
-                        "lastId": last_id,
-                    },
-                )
-                events = result.get("orderFilledEvents", [])
-                for event in events:
-                    trade = _parse_trade(event, token_id)
-                    if trade is not None:
-                        all_trades.append(trade)
-                if len(events) < _PAGE_SIZE:
-                    break
-                last_id = events[-1]["id"]
-                time.sleep(0.1)
+
+        def handle_page(events: list[dict]) -> None:
+            all_trades.extend(_parse_trades_page(events, token_id))
+
+        asyncio.run(self._fetch_pages(token_id, start_ts, end_ts, handle_page))
         return all_trades
+
+    def get_order_filled_events_table(
+        self,
+        token_id: str,
+        start_ts: int,
+        end_ts: int,
+    ) -> pa.Table:
+        """Fetch fills as an Arrow table instead of a list of Trades.
+
+        Columnar layout keeps a million fills in contiguous buffers
+        (no per-trade object allocation) and hands off zero-copy to
+        pandas or parquet downstream.
+        """
+        token_id = sys.intern(token_id)
+        batches: list[pa.RecordBatch] = []
+
+        def handle_page(events: list[dict]) -> None:
+            batch = _page_record_batch(events, token_id)
+            if batch is not None:
+                batches.append(batch)
+
+        asyncio.run(self._fetch_pages(token_id, start_ts, end_ts, handle_page))
+        return pa.Table.from_batches(batches, schema=_TRADES_SCHEMA)
@@ -1,18 +1,31 @@
 from __future__ import annotations
 
+import atexit
 import json
 import os
 import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.feather as feather
 import pyarrow.parquet as pq
 
+from pmdata.synthesis.ohlcv import _aggregate_bars
+
 if TYPE_CHECKING:
     import pandas as pd
 
+    from pmdata.models import PricePoint
+
 _DEFAULT_CACHE_DIR = Path(os.getenv("PMDATA_CACHE_DIR", "~/.pmdata/cache")).expanduser()
+_ROW_GROUP_SIZE = 14_400  # ~10 days of 1m bars; keeps range filters selective
+_COMPRESS_MIN_ROWS = 10_000  # below this, zstd costs more than it saves
 _BARS_SCHEMA = pa.schema(
     [
         pa.field("timestamp", pa.int64()),
@@ -34,69 +47,265 @@ class ParquetPriceCache:
         safe = token_id.replace("/", "_")[:64]
         return self._root / f"{safe}.parquet"
 
+    def _feather_path(self, token_id: str) -> Path:
+        safe = token_id.replace("/", "_")[:64]
+        return self._root / f"{safe}.arrow"
+
     def save_bars(self, token_id: str, df: pd.DataFrame) -> None:
         if df.empty:
             return
         if "timestamp" not in df.columns and df.index.name == "timestamp":
             df = df.reset_index()
-        table = pa.Table.from_pandas(df, schema=_BARS_SCHEMA)
-        pq.write_table(table, self._path(token_id), compression="snappy")
+        self.save_bars_arrow(token_id, pa.Table.from_pandas(df, schema=_BARS_SCHEMA))
+
+    def save_bars_arrow(self, token_id: str, table: pa.Table) -> None:
+        """Write an Arrow table of bars directly, no pandas round-trip.
 
-    def load_bars(self, token_id: str) -> pd.DataFrame | None:
+        This is the primary write path; save_bars and save_pricepoints
+        funnel through it. Callers that already hold columnar data
+        skip the DataFrame reboxing entirely.
+        """
+        if table.num_rows == 0:
+            return
+        if table.num_rows < _COMPRESS_MIN_ROWS:
+            # Tiny tables: the codec costs more than the bytes it saves.
+            pq.write_table(
+                table, self._path(token_id), compression="none", row_group_size=_ROW_GROUP_SIZE
+            )
+        else:
+            pq.write_table(
+                table,
+                self._path(token_id),
+                compression="zstd",
+                compression_level=3,
+                row_group_size=_ROW_GROUP_SIZE,
+            )
+        # Uncompressed Feather companion: memory-mapped loads skip the
+        # parquet decompress+materialize cost entirely. Parquet stays
+        # as the compact archival copy.
+        feather.write_feather(table, self._feather_path(token_id), compression="uncompressed")
+
+    def save_pricepoints(
+        self, token_id: str, points: list[PricePoint], interval_secs: int
+    ) -> None:
+        """Aggregate raw price points into bars and write them directly.
+
+        Skips the pandas DataFrame round-trip entirely: points are
+        reduced to OHLCV arrays by _aggregate_bars and the arrow table
+        is built straight from numpy.
+        """
+        if not points:
+            return
+        ts = np.fromiter((p.t for p in points), dtype=np.int64, count=len(points))
+        px = np.fromiter((p.p for p in points), dtype=np.float64, count=len(points))
+        bar_ts, opens, highs, lows, closes, volumes = _aggregate_bars(ts, px, interval_secs)
+        self.save_bars_arrow(
+            token_id,
+            pa.table([bar_ts, opens, highs, lows, closes, volumes], schema=_BARS_SCHEMA),
+        )
+
+    def load_bars(
+        self,
+        token_id: str,
+        start_ts: int | None = None,
+        end_ts: int | None = None,
+    ) -> pd.DataFrame | None:
+        """Load cached bars, optionally restricted to a timestamp range.
+
+        The Feather companion is preferred: it is memory-mapped, so the
+        load is near zero-copy and the range filter runs on Arrow
+        buffers backed by the page cache. Entries written before the
+        companion existed fall back to the parquet file, where range
+        bounds become parquet filters and row groups outside
+        [start_ts, end_ts] are never read or decompressed.
+        """
+        feather_path = self._feather_path(token_id)
+        if feather_path.exists():
+            source = pa.memory_map(str(feather_path), "r")
+            table = pa.ipc.RecordBatchFileReader(source).read_all()
+            mask = None
+            if start_ts is not None:
+                mask = pc.greater_equal(table["timestamp"], start_ts)
+            if end_ts is not None:
+                upper = pc.less_equal(table["timestamp"], end_ts)
+                mask = upper if mask is None else pc.and_(mask, upper)
+            if mask is not None:
+                table = table.filter(mask)
+            df = table.to_pandas(split_blocks=True)
+            return df.set_index("timestamp") if "timestamp" in df.columns else df
         path = self._path(token_id)
         if not path.exists():
             return None
-        df = pq.read_table(path).to_pandas()
+        filters = []
+        if start_ts is not None:
+            filters.append(("timestamp", ">=", start_ts))
+        if end_ts is not None:
+            filters.append(("timestamp", "<=", end_ts))
+        table = pq.read_table(
+            path, filters=filters or None, memory_map=True, use_threads=True
+        )
+        df = table.to_pandas(split_blocks=True, self_destruct=True)
         return df.set_index("timestamp") if "timestamp" in df.columns else df
 
+    def load_bars_arrow(self, token_id: str, columns: list[str] | None = None) -> pa.Table | None:
+        """Load bars as an Arrow table, optionally a column subset.
+
+        Memory-mapped reads stay backed by the OS page cache, and
+        column selection skips decoding the columns a caller does not
+        need; `.column(name).to_numpy()` on the result is zero-copy.
+        """
+        path = self._path(token_id)
+        if not path.exists():
+            return None
+        return pq.read_table(path, columns=columns, memory_map=True, use_threads=True)
+
     def has_bars(self, token_id: str) -> bool:
         return self._path(token_id).exists()
 
     def delete_bars(self, token_id: str) -> None:
-        path = self._path(token_id)
-        if path.exists():
-            path.unlink()
+        for path in (self._path(token_id), self._feather_path(token_id)):
+            if path.exists():
+                path.unlink()
+
+
+# One connection per database path, shared across cache instances and
+# kept open for the life of the process: repeated PolymarketData / CLI
+# construction skips the connect + PRAGMA setup, and WAL checkpointing
+# amortizes across all users of the path.
+_connections: dict[str, sqlite3.Connection] = {}
+_connections_lock = threading.Lock()
+
+
+def _get_connection(db_path: Path) -> sqlite3.Connection:
+    key = str(db_path)
+    with _connections_lock:
+        conn = _connections.get(key)
+        if conn is None:
+            conn = sqlite3.connect(key, check_same_thread=False, cached_statements=256)
+            _connections[key] = conn
+        return conn
+
+
+@atexit.register
+def _close_connections() -> None:
+    with _connections_lock:
+        for conn in _connections.values():
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        _connections.clear()
+
+
+# Forked workers must not reuse the parent's connections; drop (do not
+# close) them so each child opens its own.
+os.register_at_fork(after_in_child=_connections.clear)
+
+
+# Fixed SQL strings so the connection's prepared-statement cache
+# (cached_statements=256) gets a hit on every call.
+_SAVE_FETCH_SQL = (
+    "INSERT OR REPLACE INTO fetch_info (token_id, start_ts, end_ts, updated_at) VALUES (?,?,?,?)"
+)
+_LOAD_FETCH_SQL = "SELECT start_ts, end_ts FROM fetch_info WHERE token_id=?"
+_SAVE_MARKET_SQL = "INSERT OR REPLACE INTO markets_v2 (market_id, data, updated_at) VALUES (?,?,?)"
+_LOAD_MARKET_SQL = "SELECT data FROM markets_v2 WHERE market_id=?"
+_LOAD_MARKET_TS_SQL = "SELECT data, updated_at FROM markets_v2 WHERE market_id=?"
+_SAVE_MISS_SQL = "INSERT OR REPLACE INTO market_misses (market_id, expires_at) VALUES (?,?)"
+_LOAD_MISS_SQL = "SELECT expires_at FROM market_misses WHERE market_id=?"
 
 
 class SQLiteMetadataCache:
-    def __init__(self, cache_dir: Path | None = None) -> None:
-        db_path = (cache_dir or _DEFAULT_CACHE_DIR) / "metadata.db"
-        db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+    def __init__(self, cache_dir: Path | str | None = None) -> None:
+        if cache_dir == ":memory:":
+            # Private in-memory database (tests, throwaway scripts).
+            # Not pooled: every ":memory:" connection is its own DB, so
+            # sharing one would leak state between unrelated instances.
+            self._conn = sqlite3.connect(":memory:", check_same_thread=False)
+            self._private = True
+        else:
+            db_path = (Path(cache_dir) if cache_dir else _DEFAULT_CACHE_DIR) / "metadata.db"
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = _get_connection(db_path)
+            self._private = False
+        self._in_txn = False
         self._init_schema()
 
     def _init_schema(self) -> None:
         self._conn.executescript(
             """
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-65536;
+            PRAGMA mmap_size=268435456;
             CREATE TABLE IF NOT EXISTS fetch_info (
                 token_id TEXT PRIMARY KEY,
                 start_ts INTEGER NOT NULL,
                 end_ts INTEGER NOT NULL,
                 updated_at INTEGER NOT NULL
             );
-            CREATE TABLE IF NOT EXISTS markets (
+            CREATE TABLE IF NOT EXISTS markets_v2 (
                 market_id TEXT PRIMARY KEY,
-                data TEXT NOT NULL,
+                data BLOB NOT NULL,
                 updated_at INTEGER NOT NULL
             );
+            CREATE INDEX IF NOT EXISTS idx_fetch_end ON fetch_info(end_ts);
+            CREATE TABLE IF NOT EXISTS market_misses (
+                market_id TEXT PRIMARY KEY,
+                expires_at INTEGER NOT NULL
+            );
             """
         )
+        self._migrate_markets()
         self._conn.commit()
 
+    def _migrate_markets(self) -> None:
+        """Move rows from the legacy TEXT `markets` table into markets_v2."""
+        row = self._conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='markets'"
+        ).fetchone()
+        if row is None:
+            return
+        self._conn.executescript(
+            """
+            INSERT OR IGNORE INTO markets_v2
+                SELECT market_id, CAST(data AS BLOB), updated_at FROM markets;
+            DROP TABLE markets;
+            """
+        )
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Bundle several save_* calls into a single commit.
+
+        One fsync for the whole block instead of one per call; rolls
+        back if the block raises.
+        """
+        self._conn.execute("BEGIN IMMEDIATE")
+        self._in_txn = True
+        try:
+            yield
+        except BaseException:
+            self._conn.rollback()
+            raise
+        else:
+            self._conn.commit()
+        finally:
+            self._in_txn = False
+
+    def _commit(self) -> None:
+        if not self._in_txn:
+            self._conn.commit()
+
     def save_fetch_info(self, token_id: str, start_ts: int, end_ts: int) -> None:
         import time
 
-        sql = (
-            "INSERT OR REPLACE INTO fetch_info"
-            " (token_id, start_ts, end_ts, updated_at) VALUES (?,?,?,?)"
-        )
-        self._conn.execute(sql, (token_id, start_ts, end_ts, int(time.time())))
-        self._conn.commit()
+        self._conn.execute(_SAVE_FETCH_SQL, (token_id, start_ts, end_ts, int(time.time())))
+        self._commit()
 
     def load_fetch_info(self, token_id: str) -> dict[str, int] | None:
-        row = self._conn.execute(
-            "SELECT start_ts, end_ts FROM fetch_info WHERE token_id=?", (token_id,)
-        ).fetchone()
+        row = self._conn.execute(_LOAD_FETCH_SQL, (token_id,)).fetchone()
         if row is None:
             return None
         return {"start_ts": row[0], "end_ts": row[1]}
@@ -105,21 +314,61 @@ class SQLiteMetadataCache:
         import time
 
         self._conn.execute(
-            "INSERT OR REPLACE INTO markets (market_id, data, updated_at) VALUES (?,?,?)",
-            (market_id, json.dumps(data), int(time.time())),
+            _SAVE_MARKET_SQL, (market_id, json.dumps(data).encode(), int(time.time()))
         )
-        self._conn.commit()
+        self._commit()
+
+    def save_markets(self, items: Iterable[tuple[str, dict]]) -> None:
+        """Save many markets in one transaction.
+
+        A bulk refresh commits (and fsyncs) once for the whole batch
+        instead of once per row.
+        """
+        import time
+
+        now = int(time.time())
+        with self._conn:
+            self._conn.executemany(
+                _SAVE_MARKET_SQL,
+                ((mid, json.dumps(data).encode(), now) for mid, data in items),
+            )
 
     def load_market(self, market_id: str) -> dict | None:
-        row = self._conn.execute(
-            "SELECT data FROM markets WHERE market_id=?", (market_id,)
-        ).fetchone()
+        row = self._conn.execute(_LOAD_MARKET_SQL, (market_id,)).fetchone()
         if row is None:
             return None
         return json.loads(row[0])
 
+    def save_market_miss(self, market_id: str, ttl: float = 3600.0) -> None:
+        """Record that the API has no market for this ID (negative cache)."""
+        import time
+
+        self._conn.execute(_SAVE_MISS_SQL, (market_id, int(time.time() + ttl)))
+        self._commit()
+
+    def load_market_miss(self, market_id: str) -> bool:
+        """True if a still-valid miss is recorded for this ID."""
+        import time
+
+        row = self._conn.execute(_LOAD_MISS_SQL, (market_id,)).fetchone()
+        return row is not None and row[0] > time.time()
+
+    def load_market_with_ts(self, market_id: str) -> tuple[dict, int] | None:
+        """Load a market plus its updated_at for TTL checks."""
+        row = self._conn.execute(_LOAD_MARKET_TS_SQL, (market_id,)).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1]
+
     def close(self) -> None:
-        self._conn.close()
+        """Close a private in-memory connection; no-op otherwise.
+
+        File-backed connections are pooled per path and may be shared
+        with other cache instances, so closing them here would break
+        those; _close_connections handles teardown at process exit.
+        """
+        if self._private:
+            self._conn.close()
 
     def __enter__(self) -> SQLiteMetadataCache:
         return self
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import atexit
+import os
+import threading
 import time
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from multiprocessing import Pool, cpu_count
+from typing import TYPE_CHECKING, TypeVar
+
+import httpx
 
 from pmdata.api.clob import ClobClient
 from pmdata.api.gamma import GammaClient
 from pmdata.api.subgraph import SubgraphClient
 from pmdata.cache.impl import ParquetPriceCache, SQLiteMetadataCache
-from pmdata.models import Market, Orderbook, PriceBar, PricePoint, Trade
-from pmdata.synthesis.ohlcv import compute_ohlcv, to_dataframe
+from pmdata.models import Market, Orderbook, PricePoint, Trade
+from pmdata.synthesis.ohlcv import compute_ohlcv_arrays, to_dataframe
 from pmdata.synthesis.orderbook import SynthesisConfig, synthesize_orderbook
 
 if TYPE_CHECKING:
@@ -17,6 +23,43 @@ if TYPE_CHECKING:
 
     import pandas as pd
 
+class MarketNotFoundError(LookupError):
+    """Raised when the Gamma API reports no market for the given ID."""
+
+
+_T = TypeVar("_T", ClobClient, GammaClient)
+
+# One HTTP client per (class, timeout), shared across PolymarketData
+# instances: repeated construction — e.g. one per CLI subcommand body —
+# reuses the warm connection pool instead of paying a fresh TLS
+# handshake. Closed at process exit; SubgraphClient is not pooled
+# because it holds no connections between calls.
+_shared_clients: dict[tuple[type, float], ClobClient | GammaClient] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def _shared_client(cls: type[_T], timeout: float) -> _T:
+    key = (cls, timeout)
+    with _shared_clients_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            client = cls(timeout=timeout)
+            _shared_clients[key] = client
+        return client  # type: ignore[return-value]
+
+
+@atexit.register
+def _close_shared_clients() -> None:
+    with _shared_clients_lock:
+        for client in _shared_clients.values():
+            client.close()
+        _shared_clients.clear()
+
+
+# Forked workers must not reuse the parent's sockets; drop (do not
+# close) the pool so each child builds its own clients.
+os.register_at_fork(after_in_child=_shared_clients.clear)
+
 
 class PolymarketData:
     def __init__(
@@ -26,8 +69,8 @@ class PolymarketData:
         gamma_timeout: float = 30.0,
         subgraph_timeout: float = 60.0,
     ) -> None:
-        self._clob = ClobClient(timeout=clob_timeout)
-        self._gamma = GammaClient(timeout=gamma_timeout)
+        self._clob = _shared_client(ClobClient, clob_timeout)
+        self._gamma = _shared_client(GammaClient, gamma_timeout)
         self._subgraph = SubgraphClient(timeout=subgraph_timeout)
         self._price_cache = ParquetPriceCache(cache_dir=cache_dir)
         self._meta_cache = SQLiteMetadataCache(cache_dir=cache_dir)
@@ -71,10 +114,20 @@ class PolymarketData:
         )
 
     def get_market(self, market_id: str) -> Market:
+        # Negative cache: a recorded 404 short-circuits the round trip
+        # so loops over candidate IDs do not re-hit the API per call.
+        if self._meta_cache.load_market_miss(market_id):
+            raise MarketNotFoundError(market_id)
         cached = self._meta_cache.load_market(market_id)
         if cached:
             return Market(**cached)
-        market = self._gamma.get_market(market_id)
+        try:
+            market = self._gamma.get_market(market_id)
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code == 404:
+                self._meta_cache.save_market_miss(market_id)
+                raise MarketNotFoundError(market_id) from exc
+            raise
         self._meta_cache.save_market(market_id, market.model_dump())
         return market
 
@@ -106,13 +159,11 @@ class PolymarketData:
 
         # Skip cache when fidelity != 1 to avoid serving wrong data
         if use_cache and fidelity == 1 and self._price_cache.has_bars(token_id):
-            df = self._price_cache.load_bars(token_id)
-            if df is not None and not df.empty:
-                idx = df.index
-                mask = (idx >= start_ts) & (idx <= end_ts)
-                sliced = df.loc[mask]
-                if not sliced.empty:
-                    return sliced
+            # The range is pushed down to the cache, which only reads
+            # the row groups (or Arrow slices) that overlap it.
+            sliced = self._price_cache.load_bars(token_id, start_ts=start_ts, end_ts=end_ts)
+            if sliced is not None and not sliced.empty:
+                return sliced
 
         points = self._clob.get_prices_history(
             token_id=token_id,
@@ -120,8 +171,7 @@ class PolymarketData:
             end_ts=end_ts,
             fidelity=fidelity,
         )
-        bars = compute_ohlcv(points, interval=interval)
-        df = to_dataframe(bars)
+        df = to_dataframe(compute_ohlcv_arrays(points, interval=interval))
         # Only cache when fidelity == 1 to avoid coherency issues
         if use_cache and fidelity == 1:
             self._price_cache.save_bars(token_id, df)
@@ -165,22 +215,11 @@ class PolymarketData:
             interval="1h",
             use_cache=True,
         )
-        bars = [
-            PriceBar(
-                timestamp=int(idx),
-                open=row["open"],
-                high=row["high"],
-                low=row["low"],
-                close=row["close"],
-                volume=row["volume"],
-            )
-            for idx, row in bars_df.iterrows()
-        ]
         return synthesize_orderbook(
             token_id=token_id,
             timestamp=ts,
             recent_trades=trades,
-            price_bars=bars,
+            price_bars=(bars_df.index.to_numpy(), bars_df["close"].to_numpy()),
             config=config,
         )
 
@@ -201,9 +240,11 @@ class PolymarketData:
         )
 
     def close(self) -> None:
-        self._clob.close()
-        self._gamma.close()
-        self._meta_cache.close()
+        """No-op: the HTTP clients and sqlite connection are shared.
+
+        Sibling instances may still be using them; _close_shared_clients
+        (and the cache's own atexit hook) tear them down at process exit.
+        """
 
     def __enter__(self) -> PolymarketData:
         return self
@@ -216,3 +257,33 @@ def _to_ts(value: datetime | int) -> int:
     if isinstance(value, datetime):
         return int(value.replace(tzinfo=UTC).timestamp())
     return int(value)
+
+
+def _warm_one(token_id: str, days: int, interval: str, cache_dir: Path | None) -> int:
+    # Each worker builds its own PolymarketData: httpx clients and the
+    # sqlite connection must not be shared across fork boundaries.
+    with PolymarketData(cache_dir=cache_dir) as client:
+        df = client.fetch_and_cache(token_id, days=days, interval=interval)
+    return len(df)
+
+
+def warm_cache(
+    token_ids: list[str],
+    days: int = 90,
+    interval: str = "1m",
+    cache_dir: Path | None = None,
+    processes: int | None = None,
+) -> dict[str, int]:
+    """Fetch and cache histories for many tokens across processes.
+
+    Fans the per-token fetch+aggregate+write work out over a process
+    pool so JSON parsing and bar aggregation use every core; the WAL-
+    mode metadata cache tolerates the concurrent writers. Returns
+    token_id -> number of cached bars.
+    """
+    if not token_ids:
+        return {}
+    n = processes or min(cpu_count(), len(token_ids))
+    with Pool(processes=n) as pool:
+        counts = pool.starmap(_warm_one, [(t, days, interval, cache_dir) for t in token_ids])
+    return dict(zip(token_ids, counts, strict=True))
@@ -1,28 +1,76 @@
 from __future__ import annotations
 
-import json
 from enum import StrEnum
 from typing import Any
 
-from pydantic import BaseModel, field_validator
+import numpy as np
+from pydantic import BaseModel, ConfigDict, field_validator
+
+try:
+    # Optional C parser: bulk market ingest decodes two JSON strings
+    # per row, where orjson is 2-3x faster than stdlib.
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 
 class Interval(StrEnum):
     MAX = "max"
     ALL = "all"
     ONE_MINUTE = "1m"
+    FIVE_MINUTES = "5m"
+    FIFTEEN_MINUTES = "15m"
     ONE_HOUR = "1h"
     SIX_HOURS = "6h"
     ONE_DAY = "1d"
     ONE_WEEK = "1w"
 
+    @property
+    def seconds(self) -> int | None:
+        """Fixed bar length in seconds, or None for MAX/ALL."""
+        return _INTERVAL_SECONDS.get(self.value)
+
+
+_INTERVAL_SECONDS: dict[str, int] = {
+    "1m": 60,
+    "5m": 300,
+    "15m": 900,
+    "1h": 3600,
+    "6h": 21600,
+    "1d": 86400,
+    "1w": 604800,
+}
+
 
 class PricePoint(BaseModel):
+    # Immutable value object: hashable, and pydantic skips its
+    # setter-dispatch write path.
+    model_config = ConfigDict(frozen=True)
+
     t: int
     p: float
 
+    @classmethod
+    def new(cls, **kwargs: Any) -> PricePoint:
+        """Build from trusted values, skipping validation.
+
+        For producer code whose rows are already schema-checked; API
+        ingest keeps the validating constructor.
+        """
+        return cls.model_construct(**kwargs)
+
+    def to_dict_fast(self) -> dict:
+        """Field dict without model_dump's serializer walk.
+
+        For trusted, internally produced instances on hot paths; use
+        model_dump for anything API-facing.
+        """
+        return self.__dict__.copy()
+
 
 class PriceBar(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     timestamp: int
     open: float
     high: float
@@ -30,11 +78,21 @@ class PriceBar(BaseModel):
     close: float
     volume: float
 
+    def to_dict_fast(self) -> dict:
+        """Field dict without model_dump's serializer walk."""
+        return self.__dict__.copy()
+
 
 class OrderbookLevel(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     price: float
     size: float
 
+    def to_dict_fast(self) -> dict:
+        """Field dict without model_dump's serializer walk."""
+        return self.__dict__.copy()
+
 
 class Orderbook(BaseModel):
     timestamp: int
@@ -44,8 +102,24 @@ class Orderbook(BaseModel):
     asks: list[OrderbookLevel]
     is_synthetic: bool = False
 
+    def levels_arrays(self) -> tuple[Any, Any]:
+        """Bids and asks as (n, 2) float64 [price, size] arrays.
+
+        Columnar form for vectorized best-bid/spread/depth work; the
+        level lists stay the canonical representation.
+        """
+        bids = np.asarray(
+            [(lvl.price, lvl.size) for lvl in self.bids], dtype=np.float64
+        ).reshape(-1, 2)
+        asks = np.asarray(
+            [(lvl.price, lvl.size) for lvl in self.asks], dtype=np.float64
+        ).reshape(-1, 2)
+        return bids, asks
+
 
 class Trade(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     timestamp: int
     price: float
     size: float
@@ -53,6 +127,11 @@ class Trade(BaseModel):
     order_id: str
     token_id: str
 
+    @classmethod
+    def new(cls, **kwargs: Any) -> Trade:
+        """Build from trusted values, skipping validation."""
+        return cls.model_construct(**kwargs)
+
 
 class Market(BaseModel):
     id: str
@@ -72,5 +151,5 @@ class Market(BaseModel):
     @classmethod
     def _parse_json_list(cls, v: Any) -> list[str]:
         if isinstance(v, str):
-            return json.loads(v)
+            return _json_loads(v)
         return v
@@ -1,59 +1,147 @@
 from __future__ import annotations
 
-from collections import defaultdict
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Final
 
+import numpy as np
 import pandas as pd
 
 from pmdata.models import PriceBar, PricePoint
 
-_INTERVAL_SECONDS: dict[str, int] = {
-    "1m": 60,
-    "5m": 300,
-    "15m": 900,
-    "1h": 3600,
-    "6h": 21600,
-    "1d": 86400,
-}
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
+# Read-only: shared across every compute/resample call, and the literal
+# keys are compile-time interned so lookups are pointer comparisons.
+_INTERVAL_SECONDS: Final[Mapping[str, int]] = MappingProxyType(
+    {
+        "1m": 60,
+        "5m": 300,
+        "15m": 900,
+        "1h": 3600,
+        "6h": 21600,
+        "1d": 86400,
+    }
+)
 
-def compute_ohlcv(
+
+# Bound once at import: values on these paths are computed internally
+# and already valid, so pydantic validation is skipped.
+_new_bar = PriceBar.model_construct
+
+
+def _aggregate_bars(
+    ts: np.ndarray, prices: np.ndarray, bucket_secs: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Aggregate raw (timestamp, price) ticks into OHLCV arrays.
+
+    Buckets by ``ts // bucket_secs`` and reduces each bucket with
+    ``np.maximum.reduceat``/``np.minimum.reduceat`` instead of a
+    per-tick Python loop. Volume is the tick count per bucket.
+    """
+    ts = np.asarray(ts, dtype=np.int64)
+    prices = np.asarray(prices, dtype=np.float64)
+    # API histories are usually already time-ordered; the sortedness
+    # check is one cheap pass, while the argsort it avoids dominates
+    # the kernel at large N.
+    if ts.size > 1 and np.any(ts[1:] < ts[:-1]):
+        order = np.argsort(ts, kind="stable")
+        ts = ts[order]
+        prices = prices[order]
+    buckets = (ts // bucket_secs) * bucket_secs
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    opens = prices[starts]
+    closes = prices[np.r_[starts[1:] - 1, len(prices) - 1]]
+    highs = np.maximum.reduceat(prices, starts)
+    lows = np.minimum.reduceat(prices, starts)
+    counts = np.diff(np.r_[starts, len(prices)]).astype(np.float64)
+    return buckets[starts], opens, highs, lows, closes, counts
+
+
+def compute_ohlcv_arrays(
     points: list[PricePoint],
     interval: str = "1m",
-) -> list[PriceBar]:
+) -> dict[str, np.ndarray]:
+    """Aggregate price points into a dict of OHLCV column arrays.
+
+    The array form is the hot path: to_dataframe consumes it without
+    any per-bar pydantic construction or model_dump round-trip. Use
+    compute_ohlcv for typed PriceBar objects.
+    """
     if not points:
-        return []
+        return {
+            "timestamp": np.empty(0, dtype=np.int64),
+            "open": np.empty(0),
+            "high": np.empty(0),
+            "low": np.empty(0),
+            "close": np.empty(0),
+            "volume": np.empty(0),
+        }
     bucket_secs = _INTERVAL_SECONDS.get(interval)
     if bucket_secs is None:
         raise ValueError(f"Unknown interval {interval!r}. Valid: {list(_INTERVAL_SECONDS)}")
 
-    buckets: dict[int, list[PricePoint]] = defaultdict(list)
-    for pt in points:
-        key = (pt.t // bucket_secs) * bucket_secs
-        buckets[key].append(pt)
-
-    bars: list[PriceBar] = []
-    for ts in sorted(buckets):
-        bucket = buckets[ts]
-        prices = [p.p for p in bucket]
-        bars.append(
-            PriceBar(
-                timestamp=ts,
-                open=prices[0],
-                high=max(prices),
-                low=min(prices),
-                close=prices[-1],
-                volume=float(len(prices)),
-            )
+    t = np.fromiter((pt.t for pt in points), dtype=np.int64, count=len(points))
+    p = np.fromiter((pt.p for pt in points), dtype=np.float64, count=len(points))
+    bar_ts, opens, highs, lows, closes, volumes = _aggregate_bars(t, p, bucket_secs)
+    return {
+        "timestamp": bar_ts,
+        "open": opens,
+        "high": highs,
+        "low": lows,
+        "close": closes,
+        "volume": volumes,
+    }
+
+
+def compute_ohlcv(
+    points: list[PricePoint],
+    interval: str = "1m",
+) -> list[PriceBar]:
+    if not points:
+        return []
+    arrays = compute_ohlcv_arrays(points, interval=interval)
+    construct = _new_bar  # .tolist() values need no validation
+    return [
+        construct(timestamp=ts, open=o, high=h, low=lo, close=c, volume=v)
+        for ts, o, h, lo, c, v in zip(
+            arrays["timestamp"].tolist(),
+            arrays["open"].tolist(),
+            arrays["high"].tolist(),
+            arrays["low"].tolist(),
+            arrays["close"].tolist(),
+            arrays["volume"].tolist(),
+            strict=True,
         )
-    return bars
+    ]
 
 
-def to_dataframe(bars: list[PriceBar]) -> pd.DataFrame:
+def to_dataframe(bars: list[PriceBar] | dict[str, np.ndarray]) -> pd.DataFrame:
+    if isinstance(bars, dict):
+        if len(bars["timestamp"]) == 0:
+            return pd.DataFrame(columns=["timestamp", "open", "high", "low", "close", "volume"])
+        return pd.DataFrame(
+            {name: col for name, col in bars.items() if name != "timestamp"},
+            index=pd.Index(bars["timestamp"], name="timestamp"),
+        )
     if not bars:
         return pd.DataFrame(columns=["timestamp", "open", "high", "low", "close", "volume"])
+    # Column arrays straight from the bar fields: no per-bar dict
+    # materialization and no pandas dtype inference.
+    n = len(bars)
     return pd.DataFrame(
-        [b.model_dump() for b in bars],
-    ).set_index("timestamp")
+        {
+            "open": np.fromiter((b.open for b in bars), dtype=np.float64, count=n),
+            "high": np.fromiter((b.high for b in bars), dtype=np.float64, count=n),
+            "low": np.fromiter((b.low for b in bars), dtype=np.float64, count=n),
+            "close": np.fromiter((b.close for b in bars), dtype=np.float64, count=n),
+            "volume": np.fromiter((b.volume for b in bars), dtype=np.float64, count=n),
+        },
+        index=pd.Index(
+            np.fromiter((b.timestamp for b in bars), dtype=np.int64, count=n),
+            name="timestamp",
+        ),
+    )
 
 
 def resample_bars(bars: list[PriceBar], target_interval: str) -> list[PriceBar]:
@@ -66,34 +154,46 @@ def resample_bars(bars: list[PriceBar], target_interval: str) -> list[PriceBar]:
     if tgt_secs < src_secs:
         raise ValueError("Cannot resample to a finer interval than source data")
 
-    df = to_dataframe(bars).reset_index()
-    df["bucket"] = (df["timestamp"] // tgt_secs) * tgt_secs
-    agg = (
-        df.groupby("bucket")
-        .agg(
-            open=("open", "first"),
-            high=("high", "max"),
-            low=("low", "min"),
-            close=("close", "last"),
-            volume=("volume", "sum"),
-        )
-        .reset_index()
-    )
+    n = len(bars)
+    ts = np.fromiter((b.timestamp for b in bars), dtype=np.int64, count=n)
+    opens = np.fromiter((b.open for b in bars), dtype=np.float64, count=n)
+    highs = np.fromiter((b.high for b in bars), dtype=np.float64, count=n)
+    lows = np.fromiter((b.low for b in bars), dtype=np.float64, count=n)
+    closes = np.fromiter((b.close for b in bars), dtype=np.float64, count=n)
+    volumes = np.fromiter((b.volume for b in bars), dtype=np.float64, count=n)
+    if n > 1 and np.any(ts[1:] < ts[:-1]):
+        order = np.argsort(ts, kind="stable")
+        ts = ts[order]
+        opens, highs, lows = opens[order], highs[order], lows[order]
+        closes, volumes = closes[order], volumes[order]
+    # Same reduceat pattern as _aggregate_bars, with open/close taken
+    # from each bucket's boundary bars instead of raw ticks.
+    buckets = (ts // tgt_secs) * tgt_secs
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:] - 1, n - 1]
     return [
-        PriceBar(
-            timestamp=int(row["bucket"]),
-            open=row["open"],
-            high=row["high"],
-            low=row["low"],
-            close=row["close"],
-            volume=row["volume"],
+        _new_bar(timestamp=t, open=o, high=h, low=lo, close=c, volume=v)
+        for t, o, h, lo, c, v in zip(
+            buckets[starts].tolist(),
+            opens[starts].tolist(),
+            np.maximum.reduceat(highs, starts).tolist(),
+            np.minimum.reduceat(lows, starts).tolist(),
+            closes[ends].tolist(),
+            np.add.reduceat(volumes, starts).tolist(),
+            strict=True,
         )
-        for _, row in agg.iterrows()
     ]
 
 
 def _infer_interval_secs(bars: list[PriceBar]) -> int:
     if len(bars) < 2:
         return 60
+    # Uniformly spaced bars (the overwhelming case) resolve from the
+    # first gap; a bounded check over the leading bars confirms it.
+    step = bars[1].timestamp - bars[0].timestamp
+    head = min(len(bars), 64)
+    ts = np.fromiter((b.timestamp for b in bars[:head]), dtype=np.int64, count=head)
+    if step > 0 and bool(np.all(np.diff(ts) == step)):
+        return int(step)
     gaps = [bars[i + 1].timestamp - bars[i].timestamp for i in range(min(10, len(bars) - 1))]
     return int(sorted(gaps)[len(gaps) // 2]) or 60
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import math
-import statistics
 from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
 
 from pmdata.models import Orderbook, OrderbookLevel, PriceBar, Trade
 
 
-@dataclass
+# Frozen (and so hashable): a config can key memoized level tables.
+@dataclass(frozen=True)
 class SynthesisConfig:
     depth_levels: int = 10
     spread_multiplier: float = 1.0
@@ -17,77 +20,121 @@ class SynthesisConfig:
     liquidity_decay: float = 0.85
 
 
+# Immutable, so one default instance serves every call.
+_DEFAULT_CONFIG = SynthesisConfig()
+
+
 def _estimate_spread(recent_trades: list[Trade]) -> float:
     if len(recent_trades) < 2:
         return 0.02
-    prices = [t.price for t in recent_trades[-50:]]
-    if len(prices) < 2:
-        return 0.02
-    stdev = statistics.stdev(prices)
+    window = recent_trades[-50:]
+    prices = np.fromiter((t.price for t in window), dtype=np.float64, count=len(window))
+    stdev = float(prices.std(ddof=1))
     return max(0.005, min(0.10, stdev * 2.0))
 
 
-def _build_levels(
+@lru_cache(maxsize=32)
+def _offset_table(depth_levels: int) -> np.ndarray:
+    return 1.0 + 0.5 * np.arange(depth_levels)
+
+
+@lru_cache(maxsize=32)
+def _decay_table(depth_levels: int, decay: float) -> np.ndarray:
+    return decay ** np.arange(depth_levels)
+
+
+def _build_levels_pair(
     mid: float,
     spread_half: float,
     depth_levels: int,
     base_depth: float,
     decay: float,
-    side: str,
-) -> list[OrderbookLevel]:
-    levels: list[OrderbookLevel] = []
-    for i in range(depth_levels):
-        offset = spread_half * (1 + i * 0.5)
-        if side == "bid":
-            price = round(max(0.01, mid - offset), 4)
-        else:
-            price = round(min(0.99, mid + offset), 4)
-        depth = base_depth * (decay**i) / max(price, 1 - price)
-        levels.append(OrderbookLevel(price=price, size=round(depth, 2)))
-    return levels
+) -> tuple[list[OrderbookLevel], list[OrderbookLevel]]:
+    """Build both sides' levels from cached offset/decay tables.
+
+    The per-level offset multipliers and decay powers depend only on
+    the config, so they are memoized and computed once for the pair;
+    the price/size math runs as array ops. Prices come out already
+    monotonic (descending for bids, ascending for asks)."""
+    offsets = spread_half * _offset_table(depth_levels)
+    bid_prices = np.maximum(0.01, mid - offsets).round(4)
+    ask_prices = np.minimum(0.99, mid + offsets).round(4)
+    depth = base_depth * _decay_table(depth_levels, decay)
+    bid_sizes = np.round(depth / np.maximum(bid_prices, 1.0 - bid_prices), 2)
+    ask_sizes = np.round(depth / np.maximum(ask_prices, 1.0 - ask_prices), 2)
+    construct = OrderbookLevel.model_construct
+    bids = [
+        construct(price=p, size=s)
+        for p, s in zip(bid_prices.tolist(), bid_sizes.tolist(), strict=True)
+    ]
+    asks = [
+        construct(price=p, size=s)
+        for p, s in zip(ask_prices.tolist(), ask_sizes.tolist(), strict=True)
+    ]
+    return bids, asks
 
 
 def synthesize_orderbook(
     token_id: str,
     timestamp: int,
     recent_trades: list[Trade],
-    price_bars: list[PriceBar],
+    price_bars: list[PriceBar] | tuple[np.ndarray, np.ndarray],
     config: SynthesisConfig | None = None,
 ) -> Orderbook:
-    cfg = config or SynthesisConfig()
+    """Build a synthetic book around trades (or bars) near timestamp.
+
+    price_bars may be a list of PriceBar or a (timestamps, closes)
+    array pair; the array form avoids materializing bar objects when
+    the caller already holds columnar data.
+    """
+    cfg = config or _DEFAULT_CONFIG
 
     if recent_trades:
-        close_to_ts = sorted(recent_trades, key=lambda t: abs(t.timestamp - timestamp))
-        closest = close_to_ts[:20]
-        mid = statistics.mean(t.price for t in closest)
-    elif price_bars:
-        close_bar = min(price_bars, key=lambda b: abs(b.timestamp - timestamp))
-        mid = close_bar.close
+        # One SoA pass over the trades; mid, spread and age then reduce
+        # over views of these arrays instead of three object scans.
+        n = len(recent_trades)
+        trade_ts = np.fromiter((t.timestamp for t in recent_trades), dtype=np.int64, count=n)
+        trade_px = np.fromiter((t.price for t in recent_trades), dtype=np.float64, count=n)
+        dist = np.abs(trade_ts - timestamp)
+        closest = trade_px[np.argpartition(dist, 19)[:20]] if n > 20 else trade_px
+        mid = float(closest.mean())
+        if n >= 2:
+            stdev = float(trade_px[-50:].std(ddof=1))
+            raw_spread = max(0.005, min(0.10, stdev * 2.0))
+        else:
+            raw_spread = 0.02
+        age_hours = float(dist.min()) / 3600.0
+        age_weight = max(0.1, math.exp(-cfg.liquidity_decay * age_hours / 24.0))
     else:
-        mid = 0.50
+        if isinstance(price_bars, tuple):
+            bar_ts, bar_close = price_bars
+            if len(bar_ts):
+                mid = float(bar_close[np.abs(bar_ts - timestamp).argmin()])
+            else:
+                mid = 0.50
+        elif price_bars:
+            close_bar = min(price_bars, key=lambda b: abs(b.timestamp - timestamp))
+            mid = close_bar.close
+        else:
+            mid = 0.50
+        raw_spread = 0.02
+        age_weight = 0.3
 
     mid = max(0.01, min(0.99, mid))
-
-    raw_spread = _estimate_spread(recent_trades) if recent_trades else 0.02
     spread = max(cfg.min_spread, min(cfg.max_spread, raw_spread * cfg.spread_multiplier))
     spread_half = spread / 2.0
-
-    age_weight = _age_decay(recent_trades, timestamp, cfg.liquidity_decay)
     effective_depth = cfg.base_depth_usdc * age_weight
 
-    bids = _build_levels(
-        mid, spread_half, cfg.depth_levels, effective_depth, cfg.liquidity_decay, "bid"
-    )
-    asks = _build_levels(
-        mid, spread_half, cfg.depth_levels, effective_depth, cfg.liquidity_decay, "ask"
+    bids, asks = _build_levels_pair(
+        mid, spread_half, cfg.depth_levels, effective_depth, cfg.liquidity_decay
     )
 
     return Orderbook(
         timestamp=timestamp,
         market="",
         token_id=token_id,
-        bids=sorted(bids, key=lambda lv: lv.price, reverse=True),
-        asks=sorted(asks, key=lambda lv: lv.price),
+        bids=bids,  # _build_levels_pair emits bids descending, asks ascending
+        asks=asks,
         is_synthetic=True,
     )
 
@@ -95,11 +142,66 @@ def synthesize_orderbook(
 def _age_decay(trades: list[Trade], target_ts: int, decay: float) -> float:
     if not trades:
         return 0.3
-    nearest = min(trades, key=lambda t: abs(t.timestamp - target_ts))
-    age_hours = abs(nearest.timestamp - target_ts) / 3600.0
+    if len(trades) >= 32:
+        # Large windows: the nearest-trade scan moves into numpy.
+        ts = np.fromiter((t.timestamp for t in trades), dtype=np.int64, count=len(trades))
+        age_hours = float(np.abs(ts - target_ts).min()) / 3600.0
+    else:
+        nearest = min(trades, key=lambda t: abs(t.timestamp - target_ts))
+        age_hours = abs(nearest.timestamp - target_ts) / 3600.0
     return max(0.1, math.exp(-decay * age_hours / 24.0))
 
 
+def _synthesize_from_arrays(
+    token_id: str,
+    timestamp: int,
+    trade_ts: np.ndarray,
+    trade_px: np.ndarray,
+    bar_ts: np.ndarray,
+    bar_close: np.ndarray,
+    cfg: SynthesisConfig,
+) -> Orderbook:
+    """Array-slice equivalent of synthesize_orderbook.
+
+    Trade arrays are a sorted prefix ending at or before timestamp, so
+    the closest trades are simply the last ones: mid, spread and age
+    all reduce over tail views without rebuilding Trade objects.
+    """
+    n = trade_ts.size
+    if n:
+        mid = float(trade_px[max(0, n - 20) :].mean())
+    elif bar_ts.size:
+        mid = float(bar_close[np.abs(bar_ts - timestamp).argmin()])
+    else:
+        mid = 0.50
+    mid = max(0.01, min(0.99, mid))
+
+    if n >= 2:
+        stdev = float(trade_px[max(0, n - 50) :].std(ddof=1))
+        raw_spread = max(0.005, min(0.10, stdev * 2.0))
+    else:
+        raw_spread = 0.02
+    spread = max(cfg.min_spread, min(cfg.max_spread, raw_spread * cfg.spread_multiplier))
+
+    if n:
+        age_hours = abs(int(trade_ts[-1]) - timestamp) / 3600.0
+        age_weight = max(0.1, math.exp(-cfg.liquidity_decay * age_hours / 24.0))
+    else:
+        age_weight = 0.3
+
+    bids, asks = _build_levels_pair(
+        mid, spread / 2.0, cfg.depth_levels, cfg.base_depth_usdc * age_weight, cfg.liquidity_decay
+    )
+    return Orderbook(
+        timestamp=timestamp,
+        market="",
+        token_id=token_id,
+        bids=bids,
+        asks=asks,
+        is_synthetic=True,
+    )
+
+
 def synthesize_orderbook_series(
     token_id: str,
     timestamps: list[int],
@@ -107,13 +209,41 @@ def synthesize_orderbook_series(
     price_bars: list[PriceBar],
     config: SynthesisConfig | None = None,
 ) -> list[Orderbook]:
-    return [
-        synthesize_orderbook(
-            token_id=token_id,
-            timestamp=ts,
-            recent_trades=[t for t in all_trades if t.timestamp <= ts],
-            price_bars=[b for b in price_bars if b.timestamp <= ts],
-            config=config,
+    """Synthesize a book per timestamp from prefix views of the data.
+
+    Trades and bars are converted to sorted timestamp/price arrays
+    once; each timestamp's prefix bound is a binary search and the
+    per-book math runs on zero-copy tail views of those arrays, never
+    re-materializing Trade lists.
+    """
+    cfg = config or _DEFAULT_CONFIG
+    trades_sorted = sorted(all_trades, key=lambda t: t.timestamp)
+    bars_sorted = sorted(price_bars, key=lambda b: b.timestamp)
+    trade_ts = np.fromiter(
+        (t.timestamp for t in trades_sorted), dtype=np.int64, count=len(trades_sorted)
+    )
+    trade_px = np.fromiter(
+        (t.price for t in trades_sorted), dtype=np.float64, count=len(trades_sorted)
+    )
+    bar_ts = np.fromiter(
+        (b.timestamp for b in bars_sorted), dtype=np.int64, count=len(bars_sorted)
+    )
+    bar_close = np.fromiter(
+        (b.close for b in bars_sorted), dtype=np.float64, count=len(bars_sorted)
+    )
+    books: list[Orderbook] = []
+    for ts in timestamps:
+        n_trades = int(np.searchsorted(trade_ts, ts, side="right"))
+        n_bars = int(np.searchsorted(bar_ts, ts, side="right"))
+        books.append(
+            _synthesize_from_arrays(
+                token_id,
+                ts,
+                trade_ts[:n_trades],
+                trade_px[:n_trades],
+                bar_ts[:n_bars],
+                bar_close[:n_bars],
+                cfg,
+            )
         )
-        for ts in timestamps
-    ]
+    return books
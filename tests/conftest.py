@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+# Heavy third-party modules imported once before collection: every test
+# module that needs them then hits the import cache. When the suite is
+# sharded (pytest-xdist), each worker pays this exactly once.
+import click  # noqa: F401
+import httpx  # noqa: F401
+import pandas  # noqa: F401
+import pyarrow  # noqa: F401
+import pytest
+import respx  # noqa: F401
+
+from pmdata.synthesis.orderbook import _DEFAULT_CONFIG, _decay_table, _offset_table
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_memoized_tables() -> None:
+    """Prime the memoized synthesis lookup tables once per session.
+
+    The first orderbook test otherwise pays the table construction cost
+    inside its own timing; warming here keeps per-test durations
+    comparable across parametrized runs.
+    """
+    _offset_table(_DEFAULT_CONFIG.depth_levels)
+    _decay_table(_DEFAULT_CONFIG.depth_levels, _DEFAULT_CONFIG.liquidity_decay)
@@ -2,27 +2,40 @@
 
 from __future__ import annotations
 
+import re
 import warnings
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from pmbacktest.data import MarketDataFeed, create_data_feed_from_pmdata
 from pmbacktest.types import Outcome
 
+_EMPTY_RE = re.compile(r"empty", re.IGNORECASE)
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
-def _make_market(outcomes: list[str], token_ids: list[str]) -> MagicMock:
-    """Build a mock Market object."""
-    m = MagicMock()
-    m.outcomes = outcomes
-    m.clob_token_ids = token_ids
-    return m
+def _make_market(outcomes: list[str], token_ids: list[str]) -> SimpleNamespace:
+    """Build a stub Market object (only two attributes are read)."""
+    return SimpleNamespace(outcomes=outcomes, clob_token_ids=token_ids)
+
+
+_BAR_DTYPE = np.dtype(
+    [
+        ("timestamp", "i8"),
+        ("open", "f8"),
+        ("high", "f8"),
+        ("low", "f8"),
+        ("close", "f8"),
+        ("volume", "f8"),
+    ]
+)
 
 
 def _make_ohlcv(rows: list[tuple[int, float, float, float, float, float]]) -> pd.DataFrame:
@@ -32,31 +45,43 @@ def _make_ohlcv(rows: list[tuple[int, float, float, float, float, float]]) -> pd
     """
     if not rows:
         return pd.DataFrame(columns=["open", "high", "low", "close", "volume"])
-    timestamps, opens, highs, lows, closes, volumes = zip(*rows)
-    df = pd.DataFrame(
-        {
-            "open": list(opens),
-            "high": list(highs),
-            "low": list(lows),
-            "close": list(closes),
-            "volume": list(volumes),
-        },
-        index=pd.Index(list(timestamps), name="timestamp"),
-    )
-    return df
-
-
-def _make_client(market_map: dict, ohlcv_map: dict) -> MagicMock:
-    """Build a mock PolymarketData client.
+    arr = np.array(list(rows), dtype=_BAR_DTYPE)
+    return pd.DataFrame.from_records(arr, index="timestamp")
+
+
+class _StubPM:
+    """Minimal PolymarketData stand-in: two dict lookups plus a call
+    counter, far cheaper than a MagicMock per test.
 
     Args:
-        market_map: {market_id: mock Market}
+        market_map: {market_id: stub Market}
         ohlcv_map: {token_id: DataFrame}
     """
-    client = MagicMock()
-    client.get_market.side_effect = lambda mid: market_map[mid]
-    client.get_ohlcv.side_effect = lambda token_id, *_args, **_kwargs: ohlcv_map[token_id]
-    return client
+
+    def __init__(self, market_map: dict, ohlcv_map: dict) -> None:
+        self._markets = market_map
+        self._ohlcv = ohlcv_map
+        self.ohlcv_calls = 0
+
+    def get_market(self, market_id: str) -> SimpleNamespace:
+        return self._markets[market_id]
+
+    def get_ohlcv(self, token_id: str, *_args, **_kwargs) -> pd.DataFrame:
+        self.ohlcv_calls += 1
+        return self._ohlcv[token_id]
+
+
+def _make_client(market_map: dict, ohlcv_map: dict) -> _StubPM:
+    return _StubPM(market_map, ohlcv_map)
+
+
+_SEVEN_ROWS: tuple = tuple((1000 * i, 0.5, 0.6, 0.4, 0.5, float(i)) for i in range(1, 8))
+
+
+@pytest.fixture(scope="session")
+def single_bar_df() -> pd.DataFrame:
+    """Shared one-bar frame; construction is amortized over the session."""
+    return _make_ohlcv([(1_000_000, 0.3, 0.5, 0.2, 0.4, 100.0)])
 
 
 # ---------------------------------------------------------------------------
@@ -67,17 +92,16 @@ def _make_client(market_map: dict, ohlcv_map: dict) -> MagicMock:
 class TestSingleMarketConvertsCorrectly:
     """test_single_market_converts_correctly"""
 
-    def test_single_market_converts_correctly(self):
+    def test_single_market_converts_correctly(self, single_bar_df: pd.DataFrame):
         market = _make_market(["YES", "NO"], ["tok_yes", "tok_no"])
-        df = _make_ohlcv([(1_000_000, 0.3, 0.5, 0.2, 0.4, 100.0)])
-        client = _make_client({"mkt1": market}, {"tok_yes": df})
+        client = _make_client({"mkt1": market}, {"tok_yes": single_bar_df})
 
         feed = create_data_feed_from_pmdata(client, ["mkt1"], 0, 9_999_999)
 
         assert isinstance(feed, MarketDataFeed)
         assert len(feed) == 1
 
-        point = list(feed)[0]
+        point = next(iter(feed))
         assert point.timestamp == 1_000_000
         assert "mkt1" in point.prices
         assert "mkt1" in point.bars
@@ -93,7 +117,7 @@ class TestPricesIncludeYesAndNo:
         client = _make_client({"mkt1": market}, {"tok_yes": df})
 
         feed = create_data_feed_from_pmdata(client, ["mkt1"], 0, 9_999_999)
-        point = list(feed)[0]
+        point = next(iter(feed))
 
         yes_price = point.prices["mkt1"][Outcome.YES]
         no_price = point.prices["mkt1"][Outcome.NO]
@@ -112,7 +136,7 @@ class TestBarsPopulatedFromOhlcv:
         client = _make_client({"mkt1": market}, {"tok_yes": df})
 
         feed = create_data_feed_from_pmdata(client, ["mkt1"], 0, 9_999_999)
-        point = list(feed)[0]
+        point = next(iter(feed))
         bar = point.bars["mkt1"]
 
         assert bar.timestamp == ts
@@ -187,9 +211,11 @@ class TestTimestampsSorted:
         client = _make_client({"mkt1": market}, {"tok_yes": df})
 
         feed = create_data_feed_from_pmdata(client, ["mkt1"], 0, 9_999_999)
-        timestamps = [p.timestamp for p in feed]
 
-        assert timestamps == sorted(timestamps)
+        prev = -1
+        for point in feed:
+            assert point.timestamp >= prev
+            prev = point.timestamp
 
 
 class TestEmptyOhlcvSkipsMarket:
@@ -206,20 +232,20 @@ class TestEmptyOhlcvSkipsMarket:
 
         assert len(feed) == 0
         # A warning should have been emitted about empty data
-        assert any("empty" in str(w.message).lower() for w in caught)
+        assert any(_EMPTY_RE.search(str(w.message)) for w in caught)
 
 
 class TestIntervalPassedToFeed:
     """test_interval_passed_to_feed"""
 
-    def test_interval_passed_to_feed(self):
+    @pytest.mark.parametrize("interval", ["1m", "5m", "15m", "1h", "6h", "1d"])
+    def test_interval_passed_to_feed(self, interval: str):
         market = _make_market(["YES", "NO"], ["tok_yes", "tok_no"])
         df = _make_ohlcv([(1_000_000, 0.5, 0.6, 0.4, 0.5, 10.0)])
         client = _make_client({"mkt1": market}, {"tok_yes": df})
 
-        for interval in ("1m", "5m", "15m", "1h", "6h", "1d"):
-            feed = create_data_feed_from_pmdata(client, ["mkt1"], 0, 9_999_999, interval=interval)
-            assert feed.interval == interval
+        feed = create_data_feed_from_pmdata(client, ["mkt1"], 0, 9_999_999, interval=interval)
+        assert feed.interval == interval
 
 
 class TestNonBinaryMarketRaises:
@@ -228,16 +254,14 @@ class TestNonBinaryMarketRaises:
     def test_non_binary_market_raises(self):
         # Three outcomes → should raise ValueError
         market = _make_market(["YES", "NO", "MAYBE"], ["tok1", "tok2", "tok3"])
-        client = MagicMock()
-        client.get_market.return_value = market
+        client = _make_client({"mkt1": market}, {})
 
         with pytest.raises(ValueError, match="binary"):
             create_data_feed_from_pmdata(client, ["mkt1"], 0, 9_999_999)
 
     def test_single_outcome_raises(self):
         market = _make_market(["YES"], ["tok1"])
-        client = MagicMock()
-        client.get_market.return_value = market
+        client = _make_client({"mkt1": market}, {})
 
         with pytest.raises(ValueError):
             create_data_feed_from_pmdata(client, ["mkt1"], 0, 9_999_999)
@@ -246,26 +270,53 @@ class TestNonBinaryMarketRaises:
 class TestOutcomeCaseInsensitive:
     """test_outcome_case_insensitive"""
 
+    @pytest.fixture(scope="class")
+    def case_df(self) -> pd.DataFrame:
+        return _make_ohlcv([(1_000_000, 0.3, 0.4, 0.2, 0.35, 5.0)])
+
     @pytest.mark.parametrize("yes_label", ["YES", "yes", "Yes", "yEs"])
-    def test_outcome_case_insensitive(self, yes_label: str):
+    def test_outcome_case_insensitive(self, yes_label: str, case_df: pd.DataFrame):
         no_label = "NO" if yes_label.upper() == "YES" else "no"
         market = _make_market([yes_label, no_label], ["tok_yes", "tok_no"])
-        df = _make_ohlcv([(1_000_000, 0.3, 0.4, 0.2, 0.35, 5.0)])
-        client = _make_client({"mkt1": market}, {"tok_yes": df})
+        client = _make_client({"mkt1": market}, {"tok_yes": case_df})
 
         feed = create_data_feed_from_pmdata(client, ["mkt1"], 0, 9_999_999)
         assert len(feed) == 1
-        point = list(feed)[0]
+        point = next(iter(feed))
         assert Outcome.YES in point.prices["mkt1"]
         assert point.prices["mkt1"][Outcome.YES] == pytest.approx(0.35)
 
 
+class TestOhlcvParquetCache:
+    """test_ohlcv_parquet_cache"""
+
+    def test_second_run_loads_from_cache(self, tmp_path, single_bar_df: pd.DataFrame):
+        market = _make_market(["YES", "NO"], ["tok_yes", "tok_no"])
+        client = _make_client({"mkt1": market}, {"tok_yes": single_bar_df})
+
+        feed1 = create_data_feed_from_pmdata(client, ["mkt1"], 0, 9_999_999, cache_dir=tmp_path)
+        assert client.ohlcv_calls == 1
+
+        feed2 = create_data_feed_from_pmdata(client, ["mkt1"], 0, 9_999_999, cache_dir=tmp_path)
+        assert client.ohlcv_calls == 1  # served from parquet
+        assert len(feed1) == len(feed2) == 1
+        assert list(feed2)[0].prices["mkt1"][Outcome.YES] == pytest.approx(0.4)
+
+    def test_no_cache_dir_always_fetches(self, single_bar_df: pd.DataFrame):
+        market = _make_market(["YES", "NO"], ["tok_yes", "tok_no"])
+        client = _make_client({"mkt1": market}, {"tok_yes": single_bar_df})
+
+        create_data_feed_from_pmdata(client, ["mkt1"], 0, 9_999_999)
+        create_data_feed_from_pmdata(client, ["mkt1"], 0, 9_999_999)
+        assert client.ohlcv_calls == 2
+
+
 class TestFeedLengthMatchesTimestamps:
     """test_feed_length_matches_timestamps"""
 
     def test_feed_length_matches_timestamps(self):
         market = _make_market(["YES", "NO"], ["tok_yes", "tok_no"])
-        rows = [(1000 * i, 0.5, 0.6, 0.4, 0.5, float(i)) for i in range(1, 8)]
+        rows = _SEVEN_ROWS
         df = _make_ohlcv(rows)
         client = _make_client({"mkt1": market}, {"tok_yes": df})
 
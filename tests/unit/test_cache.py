@@ -1,17 +1,25 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import sqlite3
+from typing import TYPE_CHECKING, Final
 
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 from pmdata.cache.impl import ParquetPriceCache, SQLiteMetadataCache
+from pmdata.models import PricePoint
 
 if TYPE_CHECKING:
     from pathlib import Path
 
 
-def _sample_df() -> pd.DataFrame:
+_LONG_ID: Final = "a" * 100
+
+
+@pytest.fixture(scope="session")
+def sample_df() -> pd.DataFrame:
+    """One immutable prototype frame for the session; tests never mutate it."""
     return pd.DataFrame(
         {
             "timestamp": [0, 60, 120],
@@ -24,6 +32,16 @@ def _sample_df() -> pd.DataFrame:
     )
 
 
+@pytest.fixture(scope="session")
+def populated_cache(
+    tmp_path_factory: pytest.TempPathFactory, sample_df: pd.DataFrame
+) -> ParquetPriceCache:
+    """Cache with tok1 saved once; shared by read-only tests."""
+    cache = ParquetPriceCache(cache_dir=tmp_path_factory.mktemp("pcache"))
+    cache.save_bars("tok1", sample_df)
+    return cache
+
+
 class TestParquetPriceCache:
     @pytest.fixture
     def cache(self, tmp_path: Path) -> ParquetPriceCache:
@@ -32,31 +50,25 @@ class TestParquetPriceCache:
     def test_has_bars_false_before_save(self, cache: ParquetPriceCache):
         assert cache.has_bars("tok_unknown") is False
 
-    def test_save_and_has(self, cache: ParquetPriceCache):
-        df = _sample_df()
-        cache.save_bars("tok1", df)
-        assert cache.has_bars("tok1") is True
+    def test_save_and_has(self, populated_cache: ParquetPriceCache):
+        assert populated_cache.has_bars("tok1") is True
 
     def test_load_returns_none_if_missing(self, cache: ParquetPriceCache):
         assert cache.load_bars("tok_missing") is None
 
-    def test_save_then_load_roundtrip(self, cache: ParquetPriceCache):
-        df = _sample_df()
-        cache.save_bars("tok1", df)
-        loaded = cache.load_bars("tok1")
+    def test_save_then_load_roundtrip(self, populated_cache: ParquetPriceCache):
+        loaded = populated_cache.load_bars("tok1")
         assert loaded is not None
         assert list(loaded.columns) == ["open", "high", "low", "close", "volume"]
         assert len(loaded) == 3
 
-    def test_load_indexed_by_timestamp(self, cache: ParquetPriceCache):
-        df = _sample_df()
-        cache.save_bars("tok1", df)
-        loaded = cache.load_bars("tok1")
+    def test_load_indexed_by_timestamp(self, populated_cache: ParquetPriceCache):
+        loaded = populated_cache.load_bars("tok1")
         assert loaded is not None
         assert loaded.index.name == "timestamp"
 
-    def test_save_indexed_df(self, cache: ParquetPriceCache):
-        df = _sample_df().set_index("timestamp")
+    def test_save_indexed_df(self, cache: ParquetPriceCache, sample_df: pd.DataFrame):
+        df = sample_df.set_index("timestamp")
         cache.save_bars("tok2", df)
         loaded = cache.load_bars("tok2")
         assert loaded is not None
@@ -66,8 +78,8 @@ class TestParquetPriceCache:
         cache.save_bars("tok_empty", pd.DataFrame())
         assert cache.has_bars("tok_empty") is False
 
-    def test_delete_bars(self, cache: ParquetPriceCache):
-        df = _sample_df()
+    def test_delete_bars(self, cache: ParquetPriceCache, sample_df: pd.DataFrame):
+        df = sample_df
         cache.save_bars("tok1", df)
         cache.delete_bars("tok1")
         assert cache.has_bars("tok1") is False
@@ -75,17 +87,100 @@ class TestParquetPriceCache:
     def test_delete_nonexistent_is_noop(self, cache: ParquetPriceCache):
         cache.delete_bars("not_there")
 
-    def test_token_id_truncated_to_64(self, cache: ParquetPriceCache):
-        long_id = "a" * 100
-        df = _sample_df()
-        cache.save_bars(long_id, df)
-        assert cache.has_bars(long_id) is True
+    def test_token_id_truncated_to_64(self, cache: ParquetPriceCache, sample_df: pd.DataFrame):
+        cache.save_bars(_LONG_ID, sample_df)
+        assert cache.has_bars(_LONG_ID) is True
+
+    def test_save_bars_arrow_roundtrip(self, cache: ParquetPriceCache, sample_df: pd.DataFrame):
+        table = pa.Table.from_pandas(sample_df)
+        cache.save_bars_arrow("tok_arrow", table)
+        loaded = cache.load_bars("tok_arrow")
+        assert loaded is not None
+        assert len(loaded) == 3
+        assert loaded.index.name == "timestamp"
+
+    def test_save_bars_arrow_empty_is_noop(self, cache: ParquetPriceCache, sample_df: pd.DataFrame):
+        cache.save_bars_arrow("tok_arrow_empty", pa.Table.from_pandas(sample_df).slice(0, 0))
+        assert cache.has_bars("tok_arrow_empty") is False
+
+    def test_load_bars_timestamp_range(self, populated_cache: ParquetPriceCache):
+        loaded = populated_cache.load_bars("tok1", start_ts=60, end_ts=60)
+        assert loaded is not None
+        assert list(loaded.index) == [60]
+
+    def test_load_bars_start_only(self, populated_cache: ParquetPriceCache):
+        loaded = populated_cache.load_bars("tok1", start_ts=60)
+        assert loaded is not None
+        assert list(loaded.index) == [60, 120]
+
+    def test_save_writes_feather_companion(self, populated_cache: ParquetPriceCache):
+        assert populated_cache._feather_path("tok1").exists()
+
+    def test_load_bars_falls_back_to_parquet(
+        self, cache: ParquetPriceCache, sample_df: pd.DataFrame
+    ):
+        cache.save_bars("tok1", sample_df)
+        cache._feather_path("tok1").unlink()
+        loaded = cache.load_bars("tok1", start_ts=60)
+        assert loaded is not None
+        assert list(loaded.index) == [60, 120]
+
+    def test_load_bars_arrow(self, populated_cache: ParquetPriceCache):
+        table = populated_cache.load_bars_arrow("tok1")
+        assert table is not None
+        assert table.num_rows == 3
+        assert "close" in table.column_names
+
+    def test_load_bars_arrow_column_subset(self, populated_cache: ParquetPriceCache):
+        table = populated_cache.load_bars_arrow("tok1", columns=["timestamp", "close"])
+        assert table is not None
+        assert table.column_names == ["timestamp", "close"]
+
+    def test_load_bars_arrow_missing(self, cache: ParquetPriceCache):
+        assert cache.load_bars_arrow("tok_missing") is None
+
+    def test_save_pricepoints_aggregates(self, cache: ParquetPriceCache):
+        points = [
+            PricePoint(t=10, p=0.40),
+            PricePoint(t=30, p=0.55),
+            PricePoint(t=50, p=0.45),
+            PricePoint(t=70, p=0.60),
+            PricePoint(t=90, p=0.50),
+        ]
+        cache.save_pricepoints("tok_pp", points, interval_secs=60)
+        loaded = cache.load_bars("tok_pp")
+        assert loaded is not None
+        assert list(loaded.index) == [0, 60]
+        first = loaded.loc[0]
+        assert first["open"] == 0.40
+        assert first["high"] == 0.55
+        assert first["low"] == 0.40
+        assert first["close"] == 0.45
+        assert first["volume"] == 3.0
+
+    def test_save_pricepoints_unsorted_input(self, cache: ParquetPriceCache):
+        points = [
+            PricePoint(t=90, p=0.50),
+            PricePoint(t=10, p=0.40),
+            PricePoint(t=50, p=0.45),
+        ]
+        cache.save_pricepoints("tok_pp2", points, interval_secs=60)
+        loaded = cache.load_bars("tok_pp2")
+        assert loaded is not None
+        assert list(loaded.index) == [0, 60]
+        assert loaded.loc[0]["close"] == 0.45
+
+    def test_save_pricepoints_empty_is_noop(self, cache: ParquetPriceCache):
+        cache.save_pricepoints("tok_pp3", [], interval_secs=60)
+        assert cache.has_bars("tok_pp3") is False
 
 
 class TestSQLiteMetadataCache:
     @pytest.fixture
-    def cache(self, tmp_path: Path) -> SQLiteMetadataCache:
-        c = SQLiteMetadataCache(cache_dir=tmp_path)
+    def cache(self) -> SQLiteMetadataCache:
+        # In-memory DB: same schema and SQL, none of the per-test file
+        # creation or fsync cost of a tmp_path database.
+        c = SQLiteMetadataCache(cache_dir=":memory:")
         yield c
         c.close()
 
@@ -98,8 +193,9 @@ class TestSQLiteMetadataCache:
         assert info == {"start_ts": 1000, "end_ts": 2000}
 
     def test_fetch_info_overwrite(self, cache: SQLiteMetadataCache):
-        cache.save_fetch_info("tok1", 1000, 2000)
-        cache.save_fetch_info("tok1", 3000, 4000)
+        with cache.transaction():
+            cache.save_fetch_info("tok1", 1000, 2000)
+            cache.save_fetch_info("tok1", 3000, 4000)
         info = cache.load_fetch_info("tok1")
         assert info == {"start_ts": 3000, "end_ts": 4000}
 
@@ -112,12 +208,46 @@ class TestSQLiteMetadataCache:
         loaded = cache.load_market("mkt_1")
         assert loaded == data
 
+    def test_save_markets_batch(self, cache: SQLiteMetadataCache):
+        cache.save_markets([("mkt_a", {"question": "a"}), ("mkt_b", {"question": "b"})])
+        assert cache.load_market("mkt_a") == {"question": "a"}
+        assert cache.load_market("mkt_b") == {"question": "b"}
+
     def test_market_overwrite(self, cache: SQLiteMetadataCache):
-        cache.save_market("mkt_1", {"question": "old"})
-        cache.save_market("mkt_1", {"question": "new"})
+        with cache.transaction():
+            cache.save_market("mkt_1", {"question": "old"})
+            cache.save_market("mkt_1", {"question": "new"})
         loaded = cache.load_market("mkt_1")
         assert loaded == {"question": "new"}
 
+    def test_market_miss_false_by_default(self, cache: SQLiteMetadataCache):
+        assert cache.load_market_miss("mkt_unknown") is False
+
+    def test_market_miss_recorded(self, cache: SQLiteMetadataCache):
+        cache.save_market_miss("mkt_404")
+        assert cache.load_market_miss("mkt_404") is True
+
+    def test_market_miss_expires(self, cache: SQLiteMetadataCache):
+        cache.save_market_miss("mkt_404", ttl=-1.0)
+        assert cache.load_market_miss("mkt_404") is False
+
+    def test_migrates_legacy_markets_table(self, tmp_path: Path):
+        conn = sqlite3.connect(str(tmp_path / "metadata.db"))
+        conn.executescript(
+            """
+            CREATE TABLE markets (
+                market_id TEXT PRIMARY KEY,
+                data TEXT NOT NULL,
+                updated_at INTEGER NOT NULL
+            );
+            INSERT INTO markets VALUES ('mkt_old', '{"question": "legacy"}', 0);
+            """
+        )
+        conn.commit()
+        conn.close()
+        with SQLiteMetadataCache(cache_dir=tmp_path) as c:
+            assert c.load_market("mkt_old") == {"question": "legacy"}
+
     def test_context_manager(self, tmp_path: Path):
         with SQLiteMetadataCache(cache_dir=tmp_path) as c:
             c.save_fetch_info("tok_cm", 0, 100)
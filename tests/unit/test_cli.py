@@ -1,18 +1,47 @@
 from __future__ import annotations
 
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
 import pandas as pd
+import pyarrow as pa
 import pytest
 from click.testing import CliRunner
 
-from pmdata.cli import main
+from pmdata.cli import _parse_date, _parse_dates, main
 from pmdata.models import Market, Orderbook, OrderbookLevel, PricePoint
 
 
 @pytest.fixture
 def runner() -> CliRunner:
-    return CliRunner()
+    # catch_exceptions=False skips per-invoke traceback capture and lets
+    # real errors surface directly; click usage errors (bad parameters)
+    # still exit nonzero as usual.
+    return CliRunner(catch_exceptions=False)
+
+
+class _ClientCM:
+    """Context-manager shim standing in for PolymarketData."""
+
+    def __init__(self, instance: MagicMock) -> None:
+        self._instance = instance
+
+    def __enter__(self) -> MagicMock:
+        return self._instance
+
+    def __exit__(self, *_: object) -> None:
+        return None
+
+
+@pytest.fixture
+def pm_instance(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """The mocked client each command sees inside its `with` block.
+
+    One monkeypatch setattr instead of mock.patch's full save/restore
+    bookkeeping, and no .return_value.__enter__ traversal per test.
+    """
+    instance = MagicMock()
+    monkeypatch.setattr("pmdata.cli.PolymarketData", lambda *a, **k: _ClientCM(instance))
+    return instance
 
 
 def _mock_market() -> Market:
@@ -47,185 +76,176 @@ def _mock_orderbook() -> Orderbook:
 
 
 class TestMarketsCommand:
-    def test_table_format(self, runner: CliRunner):
-        with patch("pmdata.cli.PolymarketData") as mock_client:
-            instance = mock_client.return_value.__enter__.return_value
-            instance.get_markets.return_value = [_mock_market()]
-            result = runner.invoke(main, ["markets", "--format", "table"])
+    @pytest.mark.parametrize("fmt,needle", [("table", "mkt_1"), ("json", '"id": "mkt_1"')])
+    def test_format(self, runner: CliRunner, pm_instance: MagicMock, fmt: str, needle: str):
+        pm_instance.get_markets.return_value = [_mock_market()]
+        result = runner.invoke(main, ["markets", "--format", fmt])
         assert result.exit_code == 0
-        assert "mkt_1" in result.output
+        assert needle in result.output
 
-    def test_json_format(self, runner: CliRunner):
-        with patch("pmdata.cli.PolymarketData") as mock_client:
-            instance = mock_client.return_value.__enter__.return_value
-            instance.get_markets.return_value = [_mock_market()]
-            result = runner.invoke(main, ["markets", "--format", "json"])
+    def test_limit_passed_to_client(self, runner: CliRunner, pm_instance: MagicMock):
+        pm_instance.get_markets.return_value = []
+        result = runner.invoke(main, ["markets", "--limit", "5"])
         assert result.exit_code == 0
-        assert '"id": "mkt_1"' in result.output
-
-    def test_limit_passed_to_client(self, runner: CliRunner):
-        with patch("pmdata.cli.PolymarketData") as mock_client:
-            instance = mock_client.return_value.__enter__.return_value
-            instance.get_markets.return_value = []
-            result = runner.invoke(main, ["markets", "--limit", "5"])
-        assert result.exit_code == 0
-        instance.get_markets.assert_called_once()
-        call_kwargs = instance.get_markets.call_args
+        pm_instance.get_markets.assert_called_once()
+        call_kwargs = pm_instance.get_markets.call_args
         assert call_kwargs.kwargs.get("limit") == 5 or call_kwargs.args[2] == 5
 
 
 class TestOhlcvCommand:
-    def test_csv_output_to_stdout(self, runner: CliRunner):
-        with patch("pmdata.cli.PolymarketData") as mock_client:
-            instance = mock_client.return_value.__enter__.return_value
-            instance.get_ohlcv.return_value = _mock_ohlcv_df()
-            result = runner.invoke(
-                main,
-                ["ohlcv", "--market", "tok1", "--start", "2024-01-01", "--end", "2024-01-02"],
-            )
+    @pytest.mark.parametrize(
+        "fmt,needle",
+        [("csv", "open"), ("json", "open"), ("jsonl", '"timestamp": 1000')],
+    )
+    def test_format(self, runner: CliRunner, pm_instance: MagicMock, fmt: str, needle: str):
+        pm_instance.get_ohlcv.return_value = _mock_ohlcv_df()
+        result = runner.invoke(
+            main,
+            [
+                "ohlcv",
+                "--market",
+                "tok1",
+                "--start",
+                "2024-01-01",
+                "--end",
+                "2024-01-02",
+                "--format",
+                fmt,
+            ],
+        )
         assert result.exit_code == 0
-        assert "open" in result.output
-
-    def test_json_format(self, runner: CliRunner):
-        with patch("pmdata.cli.PolymarketData") as mock_client:
-            instance = mock_client.return_value.__enter__.return_value
-            instance.get_ohlcv.return_value = _mock_ohlcv_df()
-            result = runner.invoke(
-                main,
-                [
-                    "ohlcv",
-                    "--market",
-                    "tok1",
-                    "--start",
-                    "2024-01-01",
-                    "--end",
-                    "2024-01-02",
-                    "--format",
-                    "json",
-                ],
-            )
+        assert needle in result.output
+
+    def test_arrow_format_writes_file(self, runner: CliRunner, pm_instance: MagicMock, tmp_path):
+        out = tmp_path / "bars.arrow"
+        pm_instance.get_ohlcv.return_value = _mock_ohlcv_df()
+        result = runner.invoke(
+            main,
+            [
+                "ohlcv",
+                "--market",
+                "tok1",
+                "--start",
+                "2024-01-01",
+                "--end",
+                "2024-01-02",
+                "--format",
+                "arrow",
+                "--output",
+                str(out),
+            ],
+        )
         assert result.exit_code == 0
-        assert "open" in result.output
-
-    def test_no_cache_flag(self, runner: CliRunner):
-        with patch("pmdata.cli.PolymarketData") as mock_client:
-            instance = mock_client.return_value.__enter__.return_value
-            instance.get_ohlcv.return_value = _mock_ohlcv_df()
-            runner.invoke(
-                main,
-                [
-                    "ohlcv",
-                    "--market",
-                    "tok1",
-                    "--start",
-                    "2024-01-01",
-                    "--end",
-                    "2024-01-02",
-                    "--no-cache",
-                ],
-            )
-        call_kwargs = instance.get_ohlcv.call_args
+        table = pa.ipc.RecordBatchFileReader(pa.memory_map(str(out), "r")).read_all()
+        assert table.num_rows == 1
+
+    def test_no_cache_flag(self, runner: CliRunner, pm_instance: MagicMock):
+        pm_instance.get_ohlcv.return_value = _mock_ohlcv_df()
+        runner.invoke(
+            main,
+            [
+                "ohlcv",
+                "--market",
+                "tok1",
+                "--start",
+                "2024-01-01",
+                "--end",
+                "2024-01-02",
+                "--no-cache",
+            ],
+        )
+        call_kwargs = pm_instance.get_ohlcv.call_args
         assert call_kwargs.kwargs.get("use_cache") is False
 
 
 class TestPricesCommand:
-    def test_json_output(self, runner: CliRunner):
-        with patch("pmdata.cli.PolymarketData") as mock_client:
-            instance = mock_client.return_value.__enter__.return_value
-            instance.get_raw_prices.return_value = [PricePoint(t=1000, p=0.5)]
-            result = runner.invoke(
-                main,
-                ["prices", "--market", "tok1", "--start", "2024-01-01", "--end", "2024-01-02"],
-            )
-        assert result.exit_code == 0
-        assert "0.5" in result.output
-
-    def test_csv_format(self, runner: CliRunner):
-        with patch("pmdata.cli.PolymarketData") as mock_client:
-            instance = mock_client.return_value.__enter__.return_value
-            instance.get_raw_prices.return_value = [PricePoint(t=1000, p=0.5)]
-            result = runner.invoke(
-                main,
-                [
-                    "prices",
-                    "--market",
-                    "tok1",
-                    "--start",
-                    "2024-01-01",
-                    "--end",
-                    "2024-01-02",
-                    "--format",
-                    "csv",
-                ],
-            )
+    @pytest.mark.parametrize("fmt,needle", [("json", "0.5"), ("csv", "1000")])
+    def test_format(self, runner: CliRunner, pm_instance: MagicMock, fmt: str, needle: str):
+        pm_instance.get_raw_prices.return_value = [PricePoint(t=1000, p=0.5)]
+        result = runner.invoke(
+            main,
+            [
+                "prices",
+                "--market",
+                "tok1",
+                "--start",
+                "2024-01-01",
+                "--end",
+                "2024-01-02",
+                "--format",
+                fmt,
+            ],
+        )
         assert result.exit_code == 0
-        assert "t,p" in result.output or "1000" in result.output
+        assert needle in result.output
 
 
 class TestOrderbookCommand:
-    def test_json_output(self, runner: CliRunner):
-        with patch("pmdata.cli.PolymarketData") as mock_client:
-            instance = mock_client.return_value.__enter__.return_value
-            instance.get_synthetic_orderbook.return_value = _mock_orderbook()
-            result = runner.invoke(
-                main,
-                ["orderbook", "--market", "tok_yes", "--timestamp", "2024-01-01"],
-            )
+    @pytest.mark.parametrize("fmt,needle", [("json", "0.48"), ("table", "Orderbook")])
+    def test_format(self, runner: CliRunner, pm_instance: MagicMock, fmt: str, needle: str):
+        pm_instance.get_synthetic_orderbook.return_value = _mock_orderbook()
+        result = runner.invoke(
+            main,
+            [
+                "orderbook",
+                "--market",
+                "tok_yes",
+                "--timestamp",
+                "2024-01-01",
+                "--format",
+                fmt,
+            ],
+        )
         assert result.exit_code == 0
-        assert "0.48" in result.output
-
-    def test_table_format(self, runner: CliRunner):
-        with patch("pmdata.cli.PolymarketData") as mock_client:
-            instance = mock_client.return_value.__enter__.return_value
-            instance.get_synthetic_orderbook.return_value = _mock_orderbook()
-            result = runner.invoke(
-                main,
-                [
-                    "orderbook",
-                    "--market",
-                    "tok_yes",
-                    "--timestamp",
-                    "2024-01-01",
-                    "--format",
-                    "table",
-                ],
-            )
-        assert result.exit_code == 0
-        assert "Orderbook" in result.output
+        assert needle in result.output
 
 
 class TestFetchCommand:
-    def test_fetch_reports_bar_count(self, runner: CliRunner):
-        with patch("pmdata.cli.PolymarketData") as mock_client:
-            instance = mock_client.return_value.__enter__.return_value
-            instance.fetch_and_cache.return_value = _mock_ohlcv_df()
-            result = runner.invoke(
-                main,
-                ["fetch", "--market", "tok1", "--days", "7"],
-            )
+    def test_fetch_reports_bar_count(self, runner: CliRunner, pm_instance: MagicMock):
+        pm_instance.fetch_and_cache.return_value = _mock_ohlcv_df()
+        result = runner.invoke(
+            main,
+            ["fetch", "--market", "tok1", "--days", "7"],
+        )
         assert result.exit_code == 0
         assert "1 bars" in result.output
 
 
+class TestFetchBatchCommand:
+    def test_fetches_every_token(self, runner: CliRunner, pm_instance: MagicMock):
+        pm_instance.fetch_and_cache.return_value = _mock_ohlcv_df()
+        result = runner.invoke(
+            main,
+            ["fetch-batch", "--tokens", "tok1,tok2,tok3", "--days", "7"],
+        )
+        assert result.exit_code == 0
+        assert pm_instance.fetch_and_cache.call_count == 3
+        assert "tok2" in result.output
+
+    def test_empty_tokens_rejected(self, runner: CliRunner):
+        result = runner.invoke(main, ["fetch-batch", "--tokens", " , "])
+        assert result.exit_code != 0
+
+
 class TestParseDateHelper:
-    def test_unix_timestamp(self, runner: CliRunner):
-        with patch("pmdata.cli.PolymarketData") as mock_client:
-            instance = mock_client.return_value.__enter__.return_value
-            instance.get_raw_prices.return_value = []
-            result = runner.invoke(
-                main,
-                ["prices", "--market", "tok1", "--start", "1700000000", "--end", "1700086400"],
-            )
+    def test_unix_timestamp(self, runner: CliRunner, pm_instance: MagicMock):
+        pm_instance.get_raw_prices.return_value = []
+        result = runner.invoke(
+            main,
+            ["prices", "--market", "tok1", "--start", "1700000000", "--end", "1700086400"],
+        )
         assert result.exit_code == 0
-        call = instance.get_raw_prices.call_args
+        call = pm_instance.get_raw_prices.call_args
         assert call.kwargs.get("start") == 1700000000 or 1700000000 in call.args
 
-    def test_date_string(self, runner: CliRunner):
-        with patch("pmdata.cli.PolymarketData") as mock_client:
-            instance = mock_client.return_value.__enter__.return_value
-            instance.get_raw_prices.return_value = []
-            result = runner.invoke(
-                main,
-                ["prices", "--market", "tok1", "--start", "2024-06-01", "--end", "2024-06-02"],
-            )
+    def test_date_string(self, runner: CliRunner, pm_instance: MagicMock):
+        pm_instance.get_raw_prices.return_value = []
+        result = runner.invoke(
+            main,
+            ["prices", "--market", "tok1", "--start", "2024-06-01", "--end", "2024-06-02"],
+        )
         assert result.exit_code == 0
+
+    def test_bulk_matches_scalar(self):
+        dates = ["2024-01-01", "2024-06-15"]
+        assert _parse_dates(dates) == [_parse_date(d) for d in dates]
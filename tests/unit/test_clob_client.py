@@ -6,22 +6,50 @@ import respx
 
 from pmdata.api.clob import _CLOB_BASE, ClobClient
 
+# Canonical response bodies encoded once at import; respx would
+# otherwise json.dumps the same payload on every mocked call.
+_JSON_HEADERS = {"content-type": "application/json"}
+_HISTORY_BYTES = b'{"history": [{"t": 1000, "p": 0.5}, {"t": 1060, "p": 0.6}]}'
+_EMPTY_HISTORY_BYTES = b'{"history": []}'
+_BOOK_BYTES = (
+    b'{"timestamp": 1234567890, "market": "0xabc",'
+    b' "bids": [{"price": "0.48", "size": "100"}],'
+    b' "asks": [{"price": "0.52", "size": "80"}]}'
+)
 
-@pytest.fixture
+
+def _json_response(content: bytes) -> httpx.Response:
+    return httpx.Response(200, content=content, headers=_JSON_HEADERS)
+
+
+@pytest.fixture(scope="module")
+def _router():
+    # One transport patch for the whole module instead of per test.
+    with respx.mock(assert_all_called=False) as router:
+        yield router
+
+
+@pytest.fixture(autouse=True)
+def mock_api(_router: respx.MockRouter) -> respx.MockRouter:
+    yield _router
+    # Routes and recorded calls are per test; only the patch is shared.
+    _router.reset()
+    _router.clear()
+
+
+@pytest.fixture(scope="module")
 def client() -> ClobClient:
+    # One client per module: respx intercepts the transport, so no real
+    # sockets are held, and tests do not mutate client state.
     c = ClobClient()
     yield c
     c.close()
 
 
 class TestGetPricesHistory:
-    @respx.mock
-    def test_returns_price_points(self, client: ClobClient):
-        respx.get(f"{_CLOB_BASE}/prices-history").mock(
-            return_value=httpx.Response(
-                200,
-                json={"history": [{"t": 1000, "p": 0.5}, {"t": 1060, "p": 0.6}]},
-            )
+    def test_returns_price_points(self, client: ClobClient, mock_api: respx.MockRouter):
+        mock_api.get(f"{_CLOB_BASE}/prices-history").mock(
+            return_value=_json_response(_HISTORY_BYTES)
         )
         pts = client.get_prices_history("tok1", start_ts=1000, end_ts=2000)
         assert len(pts) == 2
@@ -29,34 +57,30 @@ class TestGetPricesHistory:
         assert pts[0].p == 0.5
         assert pts[1].t == 1060
 
-    @respx.mock
-    def test_empty_history(self, client: ClobClient):
-        respx.get(f"{_CLOB_BASE}/prices-history").mock(
-            return_value=httpx.Response(200, json={"history": []})
+    def test_empty_history(self, client: ClobClient, mock_api: respx.MockRouter):
+        mock_api.get(f"{_CLOB_BASE}/prices-history").mock(
+            return_value=_json_response(_EMPTY_HISTORY_BYTES)
         )
         pts = client.get_prices_history("tok1")
         assert pts == []
 
-    @respx.mock
-    def test_missing_history_key(self, client: ClobClient):
-        respx.get(f"{_CLOB_BASE}/prices-history").mock(return_value=httpx.Response(200, json={}))
+    def test_missing_history_key(self, client: ClobClient, mock_api: respx.MockRouter):
+        mock_api.get(f"{_CLOB_BASE}/prices-history").mock(return_value=httpx.Response(200, json={}))
         pts = client.get_prices_history("tok1")
         assert pts == []
 
-    @respx.mock
-    def test_sends_token_id_param(self, client: ClobClient):
-        route = respx.get(f"{_CLOB_BASE}/prices-history").mock(
-            return_value=httpx.Response(200, json={"history": []})
+    def test_sends_token_id_param(self, client: ClobClient, mock_api: respx.MockRouter):
+        route = mock_api.get(f"{_CLOB_BASE}/prices-history").mock(
+            return_value=_json_response(_EMPTY_HISTORY_BYTES)
         )
         client.get_prices_history("my_token")
         assert route.called
         request = route.calls[0].request
         assert b"my_token" in request.url.query
 
-    @respx.mock
-    def test_sends_start_end_ts(self, client: ClobClient):
-        route = respx.get(f"{_CLOB_BASE}/prices-history").mock(
-            return_value=httpx.Response(200, json={"history": []})
+    def test_sends_start_end_ts(self, client: ClobClient, mock_api: respx.MockRouter):
+        route = mock_api.get(f"{_CLOB_BASE}/prices-history").mock(
+            return_value=_json_response(_EMPTY_HISTORY_BYTES)
         )
         client.get_prices_history("tok", start_ts=500, end_ts=999)
         request = route.calls[0].request
@@ -65,20 +89,38 @@ class TestGetPricesHistory:
         assert "endTs=999" in query
 
 
-class TestGetOrderbook:
-    @respx.mock
-    def test_returns_orderbook(self, client: ClobClient):
-        respx.get(f"{_CLOB_BASE}/book").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "timestamp": 1234567890,
-                    "market": "0xabc",
-                    "bids": [{"price": "0.48", "size": "100"}],
-                    "asks": [{"price": "0.52", "size": "80"}],
-                },
+class TestGetPricesHistoryChunked:
+    def test_chunks_preserve_order(self, client: ClobClient, mock_api: respx.MockRouter):
+        def respond(request: httpx.Request) -> httpx.Response:
+            start = int(dict(request.url.params)["startTs"])
+            return httpx.Response(200, json={"history": [{"t": start, "p": 0.5}]})
+
+        mock_api.get(f"{_CLOB_BASE}/prices-history").mock(side_effect=respond)
+        start_ts = 0
+        end_ts = 30 * 86400  # 3 chunks at the 14-day window cap
+        pts = client.get_prices_history("tok1", start_ts=start_ts, end_ts=end_ts)
+        assert len(pts) == 3
+        assert [p.t for p in pts] == sorted(p.t for p in pts)
+
+
+class TestGetPricesHistoryBatch:
+    def test_returns_points_per_token(self, client: ClobClient, mock_api: respx.MockRouter):
+        def respond(request: httpx.Request) -> httpx.Response:
+            token = dict(request.url.params)["market"]
+            return httpx.Response(
+                200, json={"history": [{"t": 1000, "p": 0.5 if token == "tok1" else 0.7}]}
             )
-        )
+
+        mock_api.get(f"{_CLOB_BASE}/prices-history").mock(side_effect=respond)
+        result = client.get_prices_history_batch(["tok1", "tok2"], start_ts=1000, end_ts=2000)
+        assert set(result) == {"tok1", "tok2"}
+        assert result["tok1"][0].p == 0.5
+        assert result["tok2"][0].p == 0.7
+
+
+class TestGetOrderbook:
+    def test_returns_orderbook(self, client: ClobClient, mock_api: respx.MockRouter):
+        mock_api.get(f"{_CLOB_BASE}/book").mock(return_value=_json_response(_BOOK_BYTES))
         ob = client.get_orderbook("tok1")
         assert ob.market == "0xabc"
         assert ob.token_id == "tok1"
@@ -88,17 +130,17 @@ class TestGetOrderbook:
         assert len(ob.asks) == 1
         assert ob.asks[0].price == 0.52
 
-    @respx.mock
-    def test_empty_bids_asks(self, client: ClobClient):
-        respx.get(f"{_CLOB_BASE}/book").mock(
+    def test_empty_bids_asks(self, client: ClobClient, mock_api: respx.MockRouter):
+        mock_api.get(f"{_CLOB_BASE}/book").mock(
             return_value=httpx.Response(200, json={"market": "x", "bids": [], "asks": []})
         )
         ob = client.get_orderbook("tok1")
         assert ob.bids == []
         assert ob.asks == []
 
-    @respx.mock
-    def test_http_error_propagates(self, client: ClobClient):
-        respx.get(f"{_CLOB_BASE}/book").mock(return_value=httpx.Response(400, text="bad request"))
+    def test_http_error_propagates(self, client: ClobClient, mock_api: respx.MockRouter):
+        mock_api.get(f"{_CLOB_BASE}/book").mock(
+            return_value=httpx.Response(400, text="bad request")
+        )
         with pytest.raises(httpx.HTTPStatusError):
             client.get_orderbook("tok1")
@@ -1,36 +1,77 @@
 from __future__ import annotations
 
+import json
+from types import MappingProxyType
+
 import httpx
 import pytest
 import respx
 from tenacity import RetryError
 
 from pmdata.api.gamma import _GAMMA_BASE, GammaClient
+from pmdata.cache.impl import SQLiteMetadataCache
+
+# Frozen so no test mutates the shared base; tests needing variants
+# spread it into a fresh dict.
+_MARKET_RAW = MappingProxyType(
+    {
+        "id": "1",
+        "question": "Will X happen?",
+        "conditionId": "cond1",
+        "clobTokenIds": '["tok_yes","tok_no"]',
+        "outcomes": '["Yes","No"]',
+        "active": True,
+        "closed": False,
+        "resolved": False,
+    }
+)
+# Serialized once at import; respx would otherwise json.dumps the same
+# payload on every mocked call.
+_MARKET_BYTES = json.dumps(dict(_MARKET_RAW)).encode()
+_MARKET_LIST_BYTES = b"[" + _MARKET_BYTES + b"]"
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
+def _market_response(content: bytes = _MARKET_BYTES) -> httpx.Response:
+    return httpx.Response(200, content=content, headers=_JSON_HEADERS)
+
+
+@pytest.fixture(autouse=True)
+def _fast_retry(monkeypatch: pytest.MonkeyPatch) -> None:
+    # tenacity sleeps its exponential backoff between attempts; the
+    # retry tests only care about the terminal RetryError, so skip the
+    # real sleeps entirely.
+    monkeypatch.setattr("tenacity.nap.time.sleep", lambda *_: None)
+
+
+@pytest.fixture(scope="module")
+def _router():
+    # One transport patch for the whole module instead of per test.
+    with respx.mock(assert_all_called=False) as router:
+        yield router
 
-_MARKET_RAW = {
-    "id": "1",
-    "question": "Will X happen?",
-    "conditionId": "cond1",
-    "clobTokenIds": '["tok_yes","tok_no"]',
-    "outcomes": '["Yes","No"]',
-    "active": True,
-    "closed": False,
-    "resolved": False,
-}
 
+@pytest.fixture(autouse=True)
+def mock_api(_router: respx.MockRouter) -> respx.MockRouter:
+    yield _router
+    # Routes and recorded calls are per test; only the patch is shared.
+    _router.reset()
+    _router.clear()
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def client() -> GammaClient:
+    # One client per module: respx intercepts the transport, so no real
+    # sockets are held, and tests do not mutate client state.
     c = GammaClient()
     yield c
     c.close()
 
 
 class TestGetMarkets:
-    @respx.mock
-    def test_returns_markets(self, client: GammaClient):
-        respx.get(f"{_GAMMA_BASE}/markets").mock(
-            return_value=httpx.Response(200, json=[_MARKET_RAW])
+    def test_returns_markets(self, client: GammaClient, mock_api: respx.MockRouter):
+        mock_api.get(f"{_GAMMA_BASE}/markets").mock(
+            return_value=_market_response(_MARKET_LIST_BYTES)
         )
         markets = client.get_markets()
         assert len(markets) == 1
@@ -41,50 +82,83 @@ class TestGetMarkets:
         assert m.outcomes == ["Yes", "No"]
         assert m.active is True
 
-    @respx.mock
-    def test_empty_response(self, client: GammaClient):
-        respx.get(f"{_GAMMA_BASE}/markets").mock(return_value=httpx.Response(200, json=[]))
+    def test_empty_response(self, client: GammaClient, mock_api: respx.MockRouter):
+        mock_api.get(f"{_GAMMA_BASE}/markets").mock(return_value=httpx.Response(200, json=[]))
         markets = client.get_markets()
         assert markets == []
 
-    @respx.mock
-    def test_active_filter_sent(self, client: GammaClient):
-        route = respx.get(f"{_GAMMA_BASE}/markets").mock(return_value=httpx.Response(200, json=[]))
+    def test_active_filter_sent(self, client: GammaClient, mock_api: respx.MockRouter):
+        route = mock_api.get(f"{_GAMMA_BASE}/markets").mock(
+            return_value=httpx.Response(200, json=[])
+        )
         client.get_markets(active=True)
         request = route.calls[0].request
         assert b"active=true" in request.url.query
 
-    @respx.mock
-    def test_http_error_propagates(self, client: GammaClient):
-        respx.get(f"{_GAMMA_BASE}/markets").mock(return_value=httpx.Response(500, text="error"))
+    def test_http_error_propagates(self, client: GammaClient, mock_api: respx.MockRouter):
+        mock_api.get(f"{_GAMMA_BASE}/markets").mock(return_value=httpx.Response(500, text="error"))
         with pytest.raises(RetryError):
             client.get_markets()
 
 
 class TestGetMarket:
-    @respx.mock
-    def test_returns_single_market(self, client: GammaClient):
-        respx.get(f"{_GAMMA_BASE}/markets/1").mock(
-            return_value=httpx.Response(200, json=_MARKET_RAW)
-        )
+    def test_returns_single_market(self, client: GammaClient, mock_api: respx.MockRouter):
+        mock_api.get(f"{_GAMMA_BASE}/markets/1").mock(return_value=_market_response())
         m = client.get_market("1")
         assert m.id == "1"
         assert m.condition_id == "cond1"
 
-    @respx.mock
-    def test_resolved_market(self, client: GammaClient):
+    def test_resolved_market(self, client: GammaClient, mock_api: respx.MockRouter):
         raw = {**_MARKET_RAW, "resolved": True, "resolvedOutcome": "Yes"}
-        respx.get(f"{_GAMMA_BASE}/markets/1").mock(return_value=httpx.Response(200, json=raw))
+        mock_api.get(f"{_GAMMA_BASE}/markets/1").mock(return_value=httpx.Response(200, json=raw))
         m = client.get_market("1")
         assert m.resolved is True
         assert m.resolved_outcome == "Yes"
 
 
+class TestGetMarketCached:
+    def test_second_lookup_served_from_cache(self, tmp_path, mock_api: respx.MockRouter):
+        route = mock_api.get(f"{_GAMMA_BASE}/markets/1").mock(return_value=_market_response())
+        with SQLiteMetadataCache(cache_dir=tmp_path) as cache:
+            client = GammaClient(cache=cache)
+            first = client.get_market("1")
+            second = client.get_market("1")
+            client.close()
+        assert route.call_count == 1
+        assert first.id == second.id == "1"
+
+    def test_stale_entry_refetched(self, tmp_path, mock_api: respx.MockRouter):
+        route = mock_api.get(f"{_GAMMA_BASE}/markets/1").mock(return_value=_market_response())
+        with SQLiteMetadataCache(cache_dir=tmp_path) as cache:
+            client = GammaClient(cache=cache, cache_ttl=0.0)
+            client.get_market("1")
+            client.get_market("1")
+            client.close()
+        assert route.call_count == 2
+
+
 class TestIterAllMarkets:
-    @respx.mock
-    def test_stops_when_page_smaller_than_size(self, client: GammaClient):
-        respx.get(f"{_GAMMA_BASE}/markets").mock(
-            return_value=httpx.Response(200, json=[_MARKET_RAW])
+    def test_stops_when_page_smaller_than_size(
+        self, client: GammaClient, mock_api: respx.MockRouter
+    ):
+        mock_api.get(f"{_GAMMA_BASE}/markets").mock(
+            return_value=_market_response(_MARKET_LIST_BYTES)
         )
         markets = client.iter_all_markets(page_size=100)
         assert len(markets) == 1
+
+    def test_concurrent_pagination(self, client: GammaClient, mock_api: respx.MockRouter):
+        def respond(request: httpx.Request) -> httpx.Response:
+            offset = int(dict(request.url.params)["offset"])
+            # Two full pages of 2, then a short page
+            if offset < 4:
+                page = [{**_MARKET_RAW, "id": str(offset)}, {**_MARKET_RAW, "id": str(offset + 1)}]
+            elif offset == 4:
+                page = [{**_MARKET_RAW, "id": "4"}]
+            else:
+                page = []
+            return httpx.Response(200, json=page)
+
+        mock_api.get(f"{_GAMMA_BASE}/markets").mock(side_effect=respond)
+        markets = client.iter_all_markets(page_size=2, concurrency=3)
+        assert [m.id for m in markets] == ["0", "1", "2", "3", "4"]
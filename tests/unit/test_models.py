@@ -92,7 +92,27 @@ class TestOrderbook:
             is_synthetic=True,
         )
         assert ob.is_synthetic is True
-        assert ob.bids[0].price == 0.49
+
+    def test_levels_arrays(self):
+        ob = Orderbook(
+            timestamp=1000,
+            market="",
+            token_id="tok",
+            bids=[OrderbookLevel(price=0.49, size=100.0), OrderbookLevel(price=0.48, size=50.0)],
+            asks=[OrderbookLevel(price=0.51, size=80.0)],
+        )
+        bids, asks = ob.levels_arrays()
+        assert bids.shape == (2, 2)
+        assert asks.shape == (1, 2)
+        assert bids[0][0] == 0.49
+        assert bids[1][1] == 50.0
+        assert asks[0][0] == 0.51
+
+    def test_levels_arrays_empty(self):
+        ob = Orderbook(timestamp=0, market="", token_id="tok", bids=[], asks=[])
+        bids, asks = ob.levels_arrays()
+        assert bids.shape == (0, 2)
+        assert asks.shape == (0, 2)
 
 
 class TestTrade:
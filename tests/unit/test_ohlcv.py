@@ -3,7 +3,13 @@ from __future__ import annotations
 import pytest
 
 from pmdata.models import PriceBar, PricePoint
-from pmdata.synthesis.ohlcv import _infer_interval_secs, compute_ohlcv, resample_bars, to_dataframe
+from pmdata.synthesis.ohlcv import (
+    _infer_interval_secs,
+    compute_ohlcv,
+    compute_ohlcv_arrays,
+    resample_bars,
+    to_dataframe,
+)
 
 
 def _pts(pairs: list[tuple[int, float]]) -> list[PricePoint]:
@@ -66,6 +72,25 @@ class TestComputeOhlcv:
         assert bars[0].volume == 6.0
 
 
+class TestComputeOhlcvArrays:
+    def test_matches_compute_ohlcv(self):
+        pts = _pts([(0, 0.4), (30, 0.6), (61, 0.5)])
+        arrays = compute_ohlcv_arrays(pts, interval="1m")
+        bars = compute_ohlcv(pts, interval="1m")
+        assert arrays["timestamp"].tolist() == [b.timestamp for b in bars]
+        assert arrays["open"].tolist() == [b.open for b in bars]
+        assert arrays["close"].tolist() == [b.close for b in bars]
+        assert arrays["volume"].tolist() == [b.volume for b in bars]
+
+    def test_empty_input(self):
+        arrays = compute_ohlcv_arrays([])
+        assert len(arrays["timestamp"]) == 0
+
+    def test_unknown_interval_raises(self):
+        with pytest.raises(ValueError, match="Unknown interval"):
+            compute_ohlcv_arrays(_pts([(0, 0.5)]), interval="3m")
+
+
 class TestToDataframe:
     def test_empty_returns_empty_df(self):
         df = to_dataframe([])
@@ -83,6 +108,17 @@ class TestToDataframe:
         df = to_dataframe(bars)
         assert set(df.columns) == {"open", "high", "low", "close", "volume"}
 
+    def test_accepts_arrays_dict(self):
+        pts = _pts([(0, 0.5), (60, 0.6)])
+        df = to_dataframe(compute_ohlcv_arrays(pts, interval="1m"))
+        assert df.index.name == "timestamp"
+        assert len(df) == 2
+        assert df.equals(to_dataframe(compute_ohlcv(pts, interval="1m")))
+
+    def test_empty_arrays_dict(self):
+        df = to_dataframe(compute_ohlcv_arrays([]))
+        assert df.empty
+
 
 class TestResampleBars:
     def _make_1m_bars(self, n: int) -> list[PriceBar]:
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import numpy as np
+
 from pmdata.models import Orderbook, PriceBar, Trade
 from pmdata.synthesis.orderbook import (
     SynthesisConfig,
     _age_decay,
-    _build_levels,
+    _build_levels_pair,
     _estimate_spread,
     synthesize_orderbook,
     synthesize_orderbook_series,
@@ -42,34 +44,35 @@ class TestEstimateSpread:
         assert spread >= 0.005
 
 
-class TestBuildLevels:
+class TestBuildLevelsPair:
     def test_bid_prices_below_mid(self):
         mid = 0.5
         spread_half = 0.02
-        levels = _build_levels(mid, spread_half, 5, 5000.0, 0.85, "bid")
-        assert all(lv.price < mid for lv in levels)
+        bids, _ = _build_levels_pair(mid, spread_half, 5, 5000.0, 0.85)
+        assert all(lv.price < mid for lv in bids)
 
     def test_ask_prices_above_mid(self):
         mid = 0.5
         spread_half = 0.02
-        levels = _build_levels(mid, spread_half, 5, 5000.0, 0.85, "ask")
-        assert all(lv.price > mid for lv in levels)
+        _, asks = _build_levels_pair(mid, spread_half, 5, 5000.0, 0.85)
+        assert all(lv.price > mid for lv in asks)
 
     def test_depth_levels_count(self):
-        levels = _build_levels(0.5, 0.01, 10, 5000.0, 0.85, "bid")
-        assert len(levels) == 10
+        bids, asks = _build_levels_pair(0.5, 0.01, 10, 5000.0, 0.85)
+        assert len(bids) == 10
+        assert len(asks) == 10
 
     def test_bid_price_floor(self):
-        levels = _build_levels(0.02, 0.05, 5, 5000.0, 0.85, "bid")
-        assert all(lv.price >= 0.01 for lv in levels)
+        bids, _ = _build_levels_pair(0.02, 0.05, 5, 5000.0, 0.85)
+        assert all(lv.price >= 0.01 for lv in bids)
 
     def test_ask_price_ceiling(self):
-        levels = _build_levels(0.98, 0.05, 5, 5000.0, 0.85, "ask")
-        assert all(lv.price <= 0.99 for lv in levels)
+        _, asks = _build_levels_pair(0.98, 0.05, 5, 5000.0, 0.85)
+        assert all(lv.price <= 0.99 for lv in asks)
 
     def test_size_positive(self):
-        levels = _build_levels(0.5, 0.02, 5, 5000.0, 0.85, "bid")
-        assert all(lv.size > 0 for lv in levels)
+        bids, asks = _build_levels_pair(0.5, 0.02, 5, 5000.0, 0.85)
+        assert all(lv.size > 0 for lv in bids + asks)
 
 
 class TestAgeDecay:
@@ -133,6 +136,18 @@ class TestSynthesizeOrderbook:
         mid = (ob.bids[0].price + ob.asks[0].price) / 2.0
         assert abs(mid - 0.65) < 0.1
 
+    def test_mid_from_bar_arrays(self):
+        bar_arrays = (np.array([900, 960]), np.array([0.65, 0.62]))
+        ob = synthesize_orderbook("tok", 1000, [], bar_arrays)
+        mid = (ob.bids[0].price + ob.asks[0].price) / 2.0
+        assert abs(mid - 0.62) < 0.1
+
+    def test_empty_bar_arrays_fall_back(self):
+        empty = (np.array([], dtype=np.int64), np.array([]))
+        ob = synthesize_orderbook("tok", 1000, [], empty)
+        mid = (ob.bids[0].price + ob.asks[0].price) / 2.0
+        assert abs(mid - 0.50) < 0.1
+
     def test_fallback_mid_050_when_no_data(self):
         ob = synthesize_orderbook("tok", 1000, [], [])
         mid = (ob.bids[0].price + ob.asks[0].price) / 2.0